@@ -2,11 +2,14 @@
 # Memos API client: auth, CRUD, attachments, search
 
 import base64
+import logging
 import os
 from typing import Dict, List, Optional, Tuple
 
 import requests
 
+log = logging.getLogger(__name__)
+
 
 class MemosAPI:
     """Memos API client with Bearer token auth"""
@@ -84,13 +87,13 @@ class MemosAPI:
                 data = r.json()
                 return True, data.get("memos", []), data.get("nextPageToken")
             elif r.status_code in [401, 403]:
-                print(f"Authentication failed when fetching memos: HTTP {r.status_code}")
+                log.warning("Authentication failed when fetching memos: HTTP %s", r.status_code)
                 return False, [], None
             else:
-                print(f"Error fetching memos: HTTP {r.status_code}")
+                log.warning("Error fetching memos: HTTP %s", r.status_code)
                 return False, [], None
         except Exception as e:
-            print(f"Error fetching memos: {e}")
+            log.warning("Error fetching memos: %s", e)
             return False, [], None
 
     def get_memo(self, memo_name: str) -> Tuple[bool, Dict]:
@@ -103,7 +106,7 @@ class MemosAPI:
                 return True, r.json()
             return False, {}
         except Exception as e:
-            print(f"Error fetching memo {memo_name}: {e}")
+            log.warning("Error fetching memo %s: %s", memo_name, e)
             return False, {}
 
     def search_memos(self, query: str) -> Tuple[bool, List[Dict], str]:
@@ -119,7 +122,7 @@ class MemosAPI:
                 return True, data.get("memos", []), data.get("nextPageToken")
             return False, [], None
         except Exception as e:
-            print(f"Error searching memos: {e}")
+            log.warning("Error searching memos: %s", e)
             return False, [], None
 
     def create_memo(self, content: str) -> Tuple[bool, Dict]:
@@ -132,7 +135,7 @@ class MemosAPI:
             )
             return (True, r.json()) if r.status_code in [200, 201] else (False, {})
         except Exception as e:
-            print(f"Error creating memo: {e}")
+            log.warning("Error creating memo: %s", e)
             return False, {}
 
     def update_memo(self, memo_name: str, content: str) -> Tuple[bool, Dict]:
@@ -145,7 +148,7 @@ class MemosAPI:
             )
             return (True, r.json()) if r.status_code in [200, 201] else (False, {})
         except Exception as e:
-            print(f"Error updating memo {memo_name}: {e}")
+            log.warning("Error updating memo %s: %s", memo_name, e)
             return False, {}
 
     def delete_memo(self, memo_name: str) -> bool:
@@ -156,7 +159,7 @@ class MemosAPI:
             )
             return r.status_code in [200, 204]
         except Exception as e:
-            print(f"Error deleting memo {memo_name}: {e}")
+            log.warning("Error deleting memo %s: %s", memo_name, e)
             return False
 
     # -------------------------------------------------------------------------
@@ -172,7 +175,7 @@ class MemosAPI:
             )
             return r.json().get("attachments", []) if r.status_code == 200 else []
         except Exception as e:
-            print(f"Error fetching attachments for {memo_name}: {e}")
+            log.warning("Error fetching attachments for %s: %s", memo_name, e)
             return []
 
     def _upload_attachment(self, file_path: str) -> Optional[Dict]:
@@ -199,7 +202,7 @@ class MemosAPI:
                 }
             return None
         except Exception as e:
-            print(f"Error uploading attachment {file_path}: {e}")
+            log.warning("Error uploading attachment %s: %s", file_path, e)
             return None
 
     def _link_attachments(self, memo_name: str, attachment_refs: List[Dict]) -> bool:
@@ -214,7 +217,7 @@ class MemosAPI:
             )
             return r.status_code == 200
         except Exception as e:
-            print(f"Error linking attachments to {memo_name}: {e}")
+            log.warning("Error linking attachments to %s: %s", memo_name, e)
             return False
 
     def _get_mime_type(self, filename: str) -> str:
@@ -249,7 +252,7 @@ class MemosAPI:
             self._link_attachments(memo.get("name", ""), refs)
             return True, memo
         except Exception as e:
-            print(f"Error creating memo with attachments: {e}")
+            log.warning("Error creating memo with attachments: %s", e)
             return False, {}
 
     def update_memo_with_attachments(
@@ -288,7 +291,7 @@ class MemosAPI:
             self._link_attachments(memo_name, refs)
             return True, memo
         except Exception as e:
-            print(f"Error updating memo {memo_name} with attachments: {e}")
+            log.warning("Error updating memo %s with attachments: %s", memo_name, e)
             return False, {}
 
     def get_memo_comments(self, memo_name: str) -> List[Dict]:
@@ -298,9 +301,9 @@ class MemosAPI:
                 f"{self.base_url}/api/v1/{memo_name}/comments",
                 timeout=5,
             )
-            print(f"Comments URL: {self.base_url}/api/v1/{memo_name}/comments")
-            print(f"Comments response: {r.status_code} - {r.text[:200]}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Comments response: %s - %s", r.status_code, r.text[:200])
             return r.json().get("memos", []) if r.status_code == 200 else []
         except Exception as e:
-            print(f"Comments error: {e}")
+            log.warning("Comments error: %s", e)
             return []
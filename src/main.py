@@ -25,6 +25,7 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import Adw, Gio
 
+from .utils import async_executor
 from .window import MemoriesWindow
 
 
@@ -41,6 +42,9 @@ class MemoriesApplication(Adw.Application):
         self.create_action("about", self.on_about_action)
         self.create_action("preferences", self.on_preferences_action)
 
+        # Queued API and thumbnail jobs must not hold up exit
+        self.connect("shutdown", lambda *_: async_executor.shutdown())
+
     def do_activate(self):
         """Called when the application is activated.
 
@@ -1,19 +1,85 @@
 # ui/memo_edit_view.py
 # Memo editor: floating toolbar, attachments, autosave, metadata chips
 
-import threading
+import bisect
+import re
 
-from gi.repository import Adw, Gdk, Gio, GLib, Gtk, Pango
+from gi.repository import Adw, Gdk, Gio, GLib, GObject, Gtk, Pango
 
-from ..utils.markdown import MarkdownUtils
+from ..utils import async_executor
 from .view_base import ViewBase
 
+# Auto-list continuation patterns
+_NUM_LIST = re.compile(r"^(\s*)(\d+)\.\s+(.*)$")
+_BUL_LIST = re.compile(r"^(\s*)([-*+])\s+(.*)$")
+
+# Keys that are held as part of a chord rather than typed
+_MODIFIER_KEYS = frozenset((
+    Gdk.KEY_Shift_L, Gdk.KEY_Shift_R, Gdk.KEY_Control_L, Gdk.KEY_Control_R,
+    Gdk.KEY_Alt_L, Gdk.KEY_Alt_R, Gdk.KEY_Meta_L, Gdk.KEY_Meta_R,
+    Gdk.KEY_Super_L, Gdk.KEY_Super_R, Gdk.KEY_Hyper_L, Gdk.KEY_Hyper_R,
+    Gdk.KEY_Caps_Lock, Gdk.KEY_ISO_Level3_Shift,
+))
+
+# Line styles that tag the whole line and get no inline styling
+_BLOCK_STYLES = frozenset(("h1", "h2", "h3", "quote", "code_block"))
+
+# Block and list line styles, in precedence order (a heading beats a list marker)
+_LINE_STYLE = re.compile(
+    r"^(?:(?P<h1># )|(?P<h2>## )|(?P<h3>### )|(?P<quote>> )|(?P<code_block>    |\t)"
+    r"|(?P<list_number>[ \t]*\d+\.[ \t]+)|(?P<list_bullet>[ \t]*[-*+][ \t]+)).*$",
+    re.MULTILINE,
+)
+
+# Inline styles as one alternation, so each range is scanned once; the
+# group name is the tag name
+_INLINE_STYLE = re.compile(
+    r"(?P<bold>\*\*.+?\*\*)"
+    r"|(?P<italic>(?<!\*)\*(?!\*).+?(?<!\*)\*(?!\*)|_.+?_)"
+    r"|(?P<code>`.+?`)"
+    r"|(?P<strikethrough>~~.+?~~)"
+    r"|(?P<link>\[.+?\]\(.+?\))"
+)
+
+# Characters that can start any markdown style, and those needed for inline styles
+# (a character-class search scans in C, with no per-character set lookups)
+_MD_SIGIL = re.compile(r"[*_`~\[>#\t+\-0-9]|    ")
+_INLINE_SIGIL = re.compile(r"[*_`~\[]")
+
+
+def _inner_span(text, m):
+    """Offsets of the text inside an inline match, or None when nothing nests there"""
+    style = m.lastgroup
+    start, end = m.span()
+    if style == "link":
+        return start + 1, text.index("](", start + 1)
+    if style == "italic":
+        return start + 1, end - 1
+    if style in ("bold", "strikethrough"):
+        return start + 2, end - 2
+    return None
+
+
+class AttachmentItem(GObject.Object):
+    """List model item wrapping an attachment dict"""
+
+    __gtype_name__ = "AttachmentItem"
+
+    def __init__(self, attachment, saved):
+        super().__init__()
+        self.attachment = attachment
+        self.saved = saved
+
 
 class MemoEditView(ViewBase):
     """Memo editor with autosave"""
 
     MAX_FILE_SIZE = 30 * 1024 * 1024
     AUTOSAVE_DELAY = 2000
+    STYLE_DELAY = 250
+    STYLE_DELAY_LARGE = 400  # for documents over LARGE_DOC_CHARS
+    LARGE_DOC_CHARS = 5000
+    ROW_POOL_SIZE = 32
 
     def __init__(self, container, title_widget):
         super().__init__()
@@ -22,6 +88,7 @@ class MemoEditView(ViewBase):
         self.api = None
         self.current_memo = None
         self.attachments = []
+        self._attachment_paths = set()  # paths in self.attachments
         self.existing_attachments = []
         self.on_save_callback = None
         self.on_delete_callback = None
@@ -30,8 +97,37 @@ class MemoEditView(ViewBase):
         self._autosave_timeout = None
         self._last_saved_content = None
         self._update_timeout = None
+        self._last_edit = 0
+        self._style_delay = self.STYLE_DELAY
         self._ui_initialized = False
 
+        # Edits made while a key autorepeats are handled once on release
+        self._held_keycode = None
+        self._repeating = False
+        self._change_deferred = False
+
+        # Buffer text, cleared on every change
+        self._content_cache = None
+
+        # Character range edited since the last styling pass (None = clean)
+        self._dirty_start = None
+        self._dirty_end = None
+
+        # (start, end, name) collected during a styling pass
+        self._pending_tags = []
+
+        # TextTag objects by name, filled by _create_tags
+        self._tags = {}
+
+        # Saved and new attachments, bound to the attachments list
+        self._attachment_store = Gio.ListStore.new(AttachmentItem)
+
+        # Recycled attachment rows
+        self._row_pool = []
+
+        # Cancels file stats still in flight when another memo is loaded
+        self._attach_cancellable = Gio.Cancellable()
+
         self._setup_ui()
 
     def cleanup(self):
@@ -49,7 +145,10 @@ class MemoEditView(ViewBase):
         # Clear memo references
         self.current_memo = None
         self.attachments = []
+        self._attachment_paths.clear()
         self.existing_attachments = []
+        self._row_pool.clear()
+        self._attach_cancellable.cancel()
 
     # -------------------------------------------------------------------------
     # UI SETUP
@@ -72,12 +171,21 @@ class MemoEditView(ViewBase):
         self.buffer = self.text_view.get_buffer()
         self._create_tags()
         self.buffer.connect("changed", self._on_text_changed)
+        self.buffer.connect("insert-text", self._on_insert_text)
+        self.buffer.connect("delete-range", self._on_delete_range)
+        self.text_view.connect("map", self._on_text_view_mapped)
 
         # Key handler for auto-list
         key_ctrl = Gtk.EventControllerKey()
         key_ctrl.connect("key-pressed", self._on_key_pressed)
+        key_ctrl.connect("key-released", self._on_key_released)
         self.text_view.add_controller(key_ctrl)
 
+        # A release can be lost when focus moves away mid-press
+        focus_ctrl = Gtk.EventControllerFocus()
+        focus_ctrl.connect("leave", self._end_key_repeat)
+        self.text_view.add_controller(focus_ctrl)
+
         # Scrolled text area
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_vexpand(True)
@@ -109,6 +217,18 @@ class MemoEditView(ViewBase):
         self.metadata_box.add_css_class("metadata-chips")
         self.metadata_container.append(self.metadata_box)
 
+        # Fixed chip slots, toggled and relabelled on metadata refresh
+        self._chip_slots = {
+            "tag1": self._create_chip(self.tags_box, "folder-symbolic"),
+            "tag2": self._create_chip(self.tags_box, "folder-symbolic"),
+            "tag3": self._create_chip(self.tags_box, "folder-symbolic"),
+            "tag_more": self._create_chip(self.tags_box, None),
+            "pinned": self._create_chip(self.metadata_box, "view-pin-symbolic"),
+            "relations": self._create_chip(self.metadata_box, "insert-link-symbolic"),
+            "reactions": self._create_chip(self.metadata_box, "face-smile-symbolic"),
+            "comments": self._create_chip(self.metadata_box, "user-available-symbolic"),
+        }
+
         # Wrap scrolled + metadata
         editor_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         editor_box.append(scrolled)
@@ -134,12 +254,17 @@ class MemoEditView(ViewBase):
         self._ui_initialized = True
 
     def _clear_container(self):
-        """Remove all children"""
+        """Remove all children, detaching them while the container is hidden"""
+        children = []
         child = self.container.get_first_child()
         while child:
-            next_child = child.get_next_sibling()
+            children.append(child)
+            child = child.get_next_sibling()
+        visible = self.container.get_visible()
+        self.container.set_visible(False)
+        for child in children:
             self.container.remove(child)
-            child = next_child
+        self.container.set_visible(visible)
 
     def _create_toolbar(self):
         """Floating toolbar: attach, save, delete, status"""
@@ -268,6 +393,7 @@ class MemoEditView(ViewBase):
         self.attachments_list = Gtk.ListBox()
         self.attachments_list.set_selection_mode(Gtk.SelectionMode.NONE)
         self.attachments_list.add_css_class("boxed-list")
+        self.attachments_list.bind_model(self._attachment_store, self._create_attachment_row)
 
         self.attachments_scrolled = Gtk.ScrolledWindow()
         self.attachments_scrolled.set_vexpand(False)
@@ -287,6 +413,7 @@ class MemoEditView(ViewBase):
         """Load memo for editing or create new"""
         self.current_memo = memo
         self.attachments = []
+        self._attachment_paths.clear()
         self.existing_attachments = []
 
         # Clear autosave timeout
@@ -298,13 +425,22 @@ class MemoEditView(ViewBase):
         if self._update_timeout:
             self.remove_timeout(self._update_timeout)
             self._update_timeout = None
+        self._held_keycode = None
+        self._repeating = self._change_deferred = False
+
+        # Drop files still being stat'ed for the previous memo
+        self._attach_cancellable.cancel()
+        self._attach_cancellable = Gio.Cancellable()
 
-        # Clear attachments
+        # Clear attachments in one model change, then pool the new-attachment rows
+        rows = []
         child = self.attachments_list.get_first_child()
         while child:
-            next_child = child.get_next_sibling()
-            self.attachments_list.remove(child)
-            child = next_child
+            rows.append(child)
+            child = child.get_next_sibling()
+        self._attachment_store.remove_all()
+        for row in rows:
+            self._recycle_row(row)
 
         if memo:
             self.title_widget.set_title("Edit Memo")
@@ -312,9 +448,12 @@ class MemoEditView(ViewBase):
             self.buffer.set_text(memo.get("content", ""))
 
             # Existing attachments
-            for a in memo.get("resources", []) or memo.get("attachments", []):
-                self.existing_attachments.append(a)
-                self.attachments_list.append(self._create_existing_attachment_row(a))
+            self.existing_attachments = list(
+                memo.get("resources", []) or memo.get("attachments", [])
+            )
+            self._attachment_store.splice(
+                0, 0, [AttachmentItem(a, True) for a in self.existing_attachments]
+            )
             self._update_attachments_visibility()
         else:
             self.title_widget.set_title("New Memo")
@@ -355,10 +494,23 @@ class MemoEditView(ViewBase):
     def _do_save(self, content, autosave=False):
         """Execute save"""
         self._update_save_indicator("saving", autosave=autosave)
-        attachments = [] if autosave else self.attachments
+        attachments = [] if autosave else list(self.attachments)
+
+        # Let the keystroke return to the main loop before saving
+        GLib.idle_add(
+            self._dispatch_save,
+            self.current_memo,
+            content,
+            attachments,
+            autosave,
+            priority=GLib.PRIORITY_LOW,
+        )
 
+    def _dispatch_save(self, memo, content, attachments, autosave):
+        """Hand off to save callback once idle (callback runs I/O in a worker)"""
         if self.on_save_callback:
-            self.on_save_callback(self.current_memo, content, attachments, autosave)
+            self.on_save_callback(memo, content, attachments, autosave)
+        return False
 
     def on_save_complete(self, success, memo=None):
         """Called after save completes"""
@@ -407,10 +559,10 @@ class MemoEditView(ViewBase):
         return False
 
     def _get_content(self):
-        """Get buffer text"""
-        return self.buffer.get_text(
-            self.buffer.get_start_iter(), self.buffer.get_end_iter(), False
-        )
+        """Get buffer text (cached until the next change)"""
+        if self._content_cache is None:
+            self._content_cache = self.buffer.get_text(*self.buffer.get_bounds(), False)
+        return self._content_cache
 
     # -------------------------------------------------------------------------
     # METADATA
@@ -418,9 +570,17 @@ class MemoEditView(ViewBase):
 
     def _update_metadata(self, memo):
         """Populate metadata chips"""
-        for box in [self.tags_box, self.metadata_box]:
-            while child := box.get_first_child():
-                box.remove(child)
+        with self.metadata_container.freeze_notify():
+            self._populate_chips(memo)
+
+        # Fetch comments async
+        if self.api and memo and memo.get("name"):
+            self._fetch_comments(memo.get("name"))
+
+    def _populate_chips(self, memo):
+        """Show and relabel chip slots for memo"""
+        for button in self._chip_slots.values():
+            button.set_visible(False)
 
         if not memo:
             self.metadata_container.set_visible(False)
@@ -432,31 +592,21 @@ class MemoEditView(ViewBase):
         # Tags (max 3)
         tags = memo.get("tags", [])
         if tags:
-            for tag in tags[:3]:
-                self.tags_box.append(
-                    self._create_chip("folder-symbolic", f"#{tag}", "tag")
-                )
+            for i, tag in enumerate(tags[:3], 1):
+                self._show_chip(f"tag{i}", f"#{tag}", "tag")
             if len(tags) > 3:
-                self.tags_box.append(
-                    self._create_chip(None, f"+{len(tags) - 3} more", "dim")
-                )
+                self._show_chip("tag_more", f"+{len(tags) - 3} more", "dim")
             has_tags = True
 
         # Pinned
         if memo.get("pinned"):
-            self.metadata_box.append(
-                self._create_chip("view-pin-symbolic", "Pinned", "accent")
-            )
+            self._show_chip("pinned", "Pinned", "accent")
             has_metadata = True
 
         # Relations
         relations = memo.get("relations", [])
         if relations:
-            self.metadata_box.append(
-                self._create_chip(
-                    "insert-link-symbolic", f"{len(relations)} links", "dim"
-                )
-            )
+            self._show_chip("relations", f"{len(relations)} links", "dim")
             has_metadata = True
 
         # Reactions
@@ -467,19 +617,13 @@ class MemoEditView(ViewBase):
                 if isinstance(reactions[0], dict)
                 else len(reactions)
             )
-            self.metadata_box.append(
-                self._create_chip("face-smile-symbolic", f"{total} reactions", "dim")
-            )
+            self._show_chip("reactions", f"{total} reactions", "dim")
             has_metadata = True
 
         self.tags_box.set_visible(has_tags)
         self.metadata_box.set_visible(has_metadata)
         self.metadata_container.set_visible(has_tags or has_metadata)
 
-        # Fetch comments async
-        if self.api and memo.get("name"):
-            self._fetch_comments(memo.get("name"))
-
     def _fetch_comments(self, memo_name):
         """Fetch comments in background"""
 
@@ -487,35 +631,46 @@ class MemoEditView(ViewBase):
             comments = self.api.get_memo_comments(memo_name)
             GLib.idle_add(self._on_comments_loaded, comments)
 
-        threading.Thread(target=worker, daemon=True).start()
+        async_executor.submit(worker)
 
     def _on_comments_loaded(self, comments):
-        """Add comments chip"""
+        """Show comments chip"""
         if comments:
-            self.metadata_box.append(
-                self._create_chip(
-                    "user-available-symbolic", f"{len(comments)} comments", "dim"
-                )
-            )
+            self._show_chip("comments", f"{len(comments)} comments", "dim")
             self.metadata_box.set_visible(True)
             self.metadata_container.set_visible(True)
 
-    def _create_chip(self, icon_name, label_text, style="default"):
-        """Create pill button"""
+    def _create_chip(self, box, icon_name):
+        """Create hidden pill button in box"""
         button = Gtk.Button()
         button.add_css_class("pill")
-        button.add_css_class(f"chip-{style}")
+        button.chip_style = None
+        button.chip_content = None
 
         if icon_name:
-            content = Adw.ButtonContent()
-            content.set_icon_name(icon_name)
-            content.set_label(label_text)
-            button.set_child(content)
-        else:
-            button.set_label(label_text)
+            button.chip_content = Adw.ButtonContent()
+            button.chip_content.set_icon_name(icon_name)
+            button.set_child(button.chip_content)
 
+        button.set_visible(False)
+        box.append(button)
         return button
 
+    def _show_chip(self, key, label_text, style="default"):
+        """Relabel and reveal a chip slot, swapping only its variant class"""
+        button = self._chip_slots[key]
+        if button.chip_style != style:
+            if button.chip_style:
+                button.remove_css_class(f"chip-{button.chip_style}")
+            button.add_css_class(f"chip-{style}")
+            button.chip_style = style
+
+        if button.chip_content:
+            button.chip_content.set_label(label_text)
+        else:
+            button.set_label(label_text)
+        button.set_visible(True)
+
     # -------------------------------------------------------------------------
     # ATTACHMENTS
     # -------------------------------------------------------------------------
@@ -537,34 +692,69 @@ class MemoEditView(ViewBase):
 
     def _on_file_chooser_response(self, dialog, response):
         if response == Gtk.ResponseType.ACCEPT:
-            for i in range(dialog.get_files().get_n_items()):
-                self._add_attachment(dialog.get_files().get_item(i))
+            files = dialog.get_files()
+            self._add_attachments(files.get_item(i) for i in range(files.get_n_items()))
         dialog.destroy()
 
     def _on_file_dropped(self, drop_target, value, x, y):
         if isinstance(value, Gio.File):
-            self._add_attachment(value)
+            self._add_attachments((value,))
             return True
         return False
 
-    def _add_attachment(self, file):
-        info = file.query_info("standard::*", Gio.FileQueryInfoFlags.NONE, None)
+    def _add_attachments(self, files):
+        """Stat files concurrently, refreshing badges once all have answered"""
+        files = list(files)
+        if not files:
+            return
+        batch = {"left": len(files), "cancellable": self._attach_cancellable}
+        for file in files:
+            file.query_info_async(
+                "standard::name,standard::size",
+                Gio.FileQueryInfoFlags.NONE,
+                GLib.PRIORITY_DEFAULT,
+                batch["cancellable"],
+                self._on_info_ready,
+                batch,
+            )
+
+    def _on_info_ready(self, file, result, batch):
+        """Add a file once its stat is back"""
+        try:
+            info = file.query_info_finish(result)
+        except GLib.Error:
+            info = None
+        if batch["cancellable"].is_cancelled():
+            return
+
+        if info is not None:
+            self._add_attachment(file, info)
+        batch["left"] -= 1
+        if batch["left"] == 0:
+            self._update_attachments_visibility()
+            self._update_attachment_badges()
+
+    def _add_attachment(self, file, info):
         size, name = info.get_size(), info.get_name()
 
         if size > self.MAX_FILE_SIZE:
             return
-        if any(a["file"].get_path() == file.get_path() for a in self.attachments):
+        path = file.get_path()
+        if path in self._attachment_paths:
             return
 
-        attachment = {"file": file, "name": name, "size": size}
+        attachment = {"file": file, "name": name, "size": size, "path": path}
         self.attachments.append(attachment)
-        self.attachments_list.append(self._create_new_attachment_row(attachment))
-        self._update_attachments_visibility()
-        self._update_attachment_badges()
-
-    def _remove_attachment(self, attachment, row):
-        self.attachments.remove(attachment)
-        self.attachments_list.remove(row)
+        self._attachment_paths.add(path)
+        self._attachment_store.append(AttachmentItem(attachment, False))
+
+    def _remove_attachment(self, item, row):
+        self.attachments.remove(item.attachment)
+        self._attachment_paths.discard(item.attachment["path"])
+        found, position = self._attachment_store.find(item)
+        if found:
+            self._attachment_store.remove(position)
+        self._recycle_row(row)
         self._update_attachments_visibility()
         self._update_attachment_badges()
 
@@ -580,6 +770,12 @@ class MemoEditView(ViewBase):
             len(self.attachments) + len(self.existing_attachments) > 0
         )
 
+    def _create_attachment_row(self, item):
+        """Build the row for an AttachmentItem"""
+        if item.saved:
+            return self._create_existing_attachment_row(item.attachment)
+        return self._create_new_attachment_row(item)
+
     def _create_existing_attachment_row(self, attachment):
         """Row for saved attachment"""
         row = Gtk.ListBoxRow()
@@ -622,8 +818,18 @@ class MemoEditView(ViewBase):
         row.set_child(box)
         return row
 
-    def _create_new_attachment_row(self, attachment):
-        """Row for new attachment"""
+    def _create_new_attachment_row(self, item):
+        """Row for new attachment, reusing a pooled row when available"""
+        attachment = item.attachment
+        if self._row_pool:
+            row = self._row_pool.pop()
+            row.name_lbl.set_label(attachment["name"])
+            row.size_lbl.set_label(f"{attachment['size'] / 1024:.1f} KB")
+            row.remove_handler = row.remove_btn.connect(
+                "clicked", lambda b: self._remove_attachment(item, row)
+            )
+            return row
+
         row = Gtk.ListBoxRow()
         box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
         box.set_margin_top(8)
@@ -656,14 +862,27 @@ class MemoEditView(ViewBase):
 
         remove_btn = Gtk.Button(icon_name="user-trash-symbolic")
         remove_btn.add_css_class("flat")
-        remove_btn.connect(
-            "clicked", lambda b: self._remove_attachment(attachment, row)
-        )
         box.append(remove_btn)
 
         row.set_child(box)
+        row.name_lbl = name
+        row.size_lbl = size_lbl
+        row.remove_btn = remove_btn
+        row.remove_handler = remove_btn.connect(
+            "clicked", lambda b: self._remove_attachment(item, row)
+        )
         return row
 
+    def _recycle_row(self, row):
+        """Return a new-attachment row to the pool"""
+        if not hasattr(row, "remove_btn"):
+            return
+        if row.remove_handler:
+            row.remove_btn.disconnect(row.remove_handler)
+            row.remove_handler = None
+        if len(self._row_pool) < self.ROW_POOL_SIZE:
+            self._row_pool.append(row)
+
     # -------------------------------------------------------------------------
     # SAVE / DELETE
     # -------------------------------------------------------------------------
@@ -680,14 +899,16 @@ class MemoEditView(ViewBase):
     # -------------------------------------------------------------------------
 
     def _create_tags(self):
-        """Text tags for markdown"""
+        """Text tags for markdown, kept by name for direct apply_tag calls"""
         t = self.buffer.get_tag_table()
+        self._tags.clear()
 
         def add(name, **props):
             tag = Gtk.TextTag(name=name)
             for k, v in props.items():
                 tag.set_property(k, v)
             t.add(tag)
+            self._tags[name] = tag
 
         add("h1", scale=2.0, weight=Pango.Weight.BOLD)
         add("h2", scale=1.5, weight=Pango.Weight.BOLD)
@@ -705,61 +926,169 @@ class MemoEditView(ViewBase):
 
     def _on_text_changed(self, buffer):
         """Markdown styling + autosave"""
-        if self._update_timeout:
-            self.remove_timeout(self._update_timeout)
-        self._update_timeout = self.add_timeout(
-            GLib.timeout_add(50, self._apply_markdown_styling)
-        )
+        self._content_cache = None
+
+        # Autorepeat: wait for the key release instead of touching timers
+        if self._repeating:
+            self._change_deferred = True
+            return
+
+        # One low-priority timer polls for quiet instead of re-arming per keystroke;
+        # long documents wait longer so fast typing doesn't restyle mid-word
+        self._last_edit = GLib.get_monotonic_time()
+        if buffer.get_char_count() > self.LARGE_DOC_CHARS:
+            self._style_delay = self.STYLE_DELAY_LARGE
+        else:
+            self._style_delay = self.STYLE_DELAY
+        if not self._update_timeout:
+            self._update_timeout = self.add_timeout(
+                GLib.timeout_add(
+                    self._style_delay, self._maybe_style, priority=GLib.PRIORITY_LOW
+                )
+            )
 
         self._schedule_autosave()
 
-    def _apply_markdown_styling(self):
-        """Apply markdown tags using MarkdownUtils"""
-        start, end = self.buffer.get_start_iter(), self.buffer.get_end_iter()
-        self.buffer.remove_all_tags(start, end)
-
-        text = self.buffer.get_text(start, end, False)
-        offset = 0
-
-        for line in text.split("\n"):
-            length = len(line)
-
-            # Parse line-level styles
-            style_type, data = MarkdownUtils.parse_line_style(line)
-            
-            if style_type == "h1":
-                self._tag(offset, offset + length, "h1")
-            elif style_type == "h2":
-                self._tag(offset, offset + length, "h2")
-            elif style_type == "h3":
-                self._tag(offset, offset + length, "h3")
-            elif style_type == "quote":
-                self._tag(offset, offset + length, "quote")
-            elif style_type == "code_block":
-                self._tag(offset, offset + length, "code_block")
-            elif style_type == "list_number":
-                self._tag(offset, offset + data["marker_len"], "list_number")
-                self._tag(offset, offset + length, "list_item")
-            elif style_type == "list_bullet":
-                self._tag(offset, offset + data["marker_len"], "list_bullet")
-                self._tag(offset, offset + length, "list_item")
-
-            # Apply inline patterns if appropriate
-            if MarkdownUtils.should_apply_inline_patterns(line):
-                for start_pos, end_pos, pattern_type in MarkdownUtils.find_inline_patterns(line):
-                    self._tag(offset + start_pos, offset + end_pos, pattern_type)
-
-            offset += length + 1
+    def _maybe_style(self):
+        """Style once the buffer has been quiet for the current style delay"""
+        if GLib.get_monotonic_time() - self._last_edit < self._style_delay * 1000:
+            return True
+        self.remove_timeout(self._update_timeout)
+        return self._apply_markdown_styling()
+
+    def _on_insert_text(self, buffer, location, text, length):
+        """Grow the dirty range over inserted text"""
+        pos = location.get_offset()
+        self._mark_dirty(pos, pos, len(text))
+
+    def _on_delete_range(self, buffer, start, end):
+        """Collapse the dirty range over deleted text"""
+        pos, stop = start.get_offset(), end.get_offset()
+        self._mark_dirty(pos, stop, pos - stop)
+
+    def _mark_dirty(self, start, end, delta):
+        """Shift the dirty range by an edit of [start, end) that moves text by delta"""
+        if self._dirty_start is None:
+            self._dirty_start = start
+            self._dirty_end = start + max(delta, 0)
+            return
 
+        def shift(offset):
+            if offset >= end:
+                return offset + delta
+            return start if offset > start else offset  # inside a deleted span
+
+        self._dirty_start = min(shift(self._dirty_start), start)
+        self._dirty_end = max(shift(self._dirty_end), start + max(delta, 0))
+
+    def _apply_markdown_styling(self):
+        """Apply markdown tags to the lines touched since the last pass"""
         self._update_timeout = None
+        if self._dirty_start is None:
+            return False
+
+        # Nothing to see while hidden; the dirty range is styled on map
+        if not self.text_view.get_mapped():
+            return False
+
+        # Expand the dirty range out to whole lines and read only those
+        buffer = self.buffer
+        start_iter = buffer.get_iter_at_offset(self._dirty_start)
+        start_iter.set_line_offset(0)
+        end_iter = buffer.get_iter_at_offset(self._dirty_end)
+        if not end_iter.ends_line():
+            end_iter.forward_to_line_end()
+        base = start_iter.get_offset()
+        self._dirty_start = self._dirty_end = None
+
+        # Every tag in this buffer is a markdown tag, so clear the span in one call
+        buffer.remove_all_tags(start_iter, end_iter)
+
+        # Plain prose: nothing to tag. get_slice keeps a placeholder for embedded
+        # anchors/images, so string offsets line up with buffer offsets
+        text = buffer.get_slice(start_iter, end_iter, True)
+        if not _MD_SIGIL.search(text):
+            return False
+
+        # Classify every line in one pass; block lines get no inline styling.
+        # Matches are queued straight onto the list to keep per-match work small
+        queue = self._pending_tags.append
+        try:
+            block_starts = []
+            block_ends = []
+            for m in _LINE_STYLE.finditer(text):
+                style_type = m.lastgroup
+                line_start, line_end = m.span()
+                if style_type in _BLOCK_STYLES:
+                    queue((base + line_start, base + line_end, style_type))
+                    block_starts.append(line_start)
+                    block_ends.append(line_end)
+                else:
+                    queue((base + line_start, base + m.end(style_type), style_type))
+                    queue((base + line_start, base + line_end, "list_item"))
+
+            # Inline patterns never cross a newline, so scan the whole range at once
+            if _INLINE_SIGIL.search(text):
+                bisect_right = bisect.bisect_right
+                inline_sigil = _INLINE_SIGIL.search
+                for m in _INLINE_STYLE.finditer(text):
+                    start_pos, end_pos = m.span()
+                    i = bisect_right(block_starts, start_pos) - 1
+                    if i >= 0 and start_pos <= block_ends[i]:
+                        continue
+                    queue((base + start_pos, base + end_pos, m.lastgroup))
+
+                    # The alternation never overlaps matches, so rescan the
+                    # inside of a match for nested styles (bold in a link etc.)
+                    nested = [m]
+                    while nested:
+                        outer = nested.pop()
+                        inner = _inner_span(text, outer)
+                        if inner is None or not inline_sigil(text, *inner):
+                            continue
+                        for n in _INLINE_STYLE.finditer(text, *inner):
+                            queue((base + n.start(), base + n.end(), n.lastgroup))
+                            nested.append(n)
+
+            self._flush_tags(start_iter, base)
+        finally:
+            # Never carry offsets from this pass into the next one
+            self._pending_tags.clear()
         return False
 
-    def _tag(self, start, end, name):
-        self.buffer.apply_tag_by_name(
-            name,
-            self.buffer.get_iter_at_offset(start),
-            self.buffer.get_iter_at_offset(end),
-        )
+    def _on_text_view_mapped(self, text_view):
+        """Style edits made while the editor was hidden"""
+        if self._dirty_start is not None and not self._update_timeout:
+            self._apply_markdown_styling()
+
+    def _flush_tags(self, cur, cur_off):
+        """Apply queued tags in offset order, walking iter cur (at cur_off) forward"""
+        pending = self._pending_tags
+        if not pending:
+            return
+        pending.sort()
+
+        tags = self._tags
+        apply_tag = self.buffer.apply_tag
+        for start, end, name in pending:
+            cur.forward_chars(start - cur_off)
+            cur_off = start
+            tag_end = cur.copy()
+            tag_end.forward_chars(end - start)
+            apply_tag(tags[name], cur, tag_end)
+
+    def _on_key_released(self, controller, keyval, keycode, state):
+        """End autorepeat when the held key comes up"""
+        if keycode == self._held_keycode:
+            self._end_key_repeat()
+
+    def _end_key_repeat(self, *args):
+        """Run the change handling deferred during autorepeat"""
+        self._held_keycode = None
+        self._repeating = False
+        if self._change_deferred:
+            self._change_deferred = False
+            self._on_text_changed(self.buffer)
 
     # -------------------------------------------------------------------------
     # AUTO-LIST
@@ -767,8 +1096,14 @@ class MemoEditView(ViewBase):
 
     def _on_key_pressed(self, controller, keyval, keycode, state):
         """Continue lists on Enter"""
-        import re
-        
+        # Only the same physical key arriving again before its release is
+        # autorepeat; modifiers never are, so Shift or Ctrl chords stall nothing
+        if keyval not in _MODIFIER_KEYS:
+            if keycode == self._held_keycode:
+                self._repeating = True
+            else:
+                self._end_key_repeat()
+                self._held_keycode = keycode
         if keyval != Gdk.KEY_Return:
             return False
 
@@ -777,7 +1112,12 @@ class MemoEditView(ViewBase):
         line_start.set_line_offset(0)
         line_text = self.buffer.get_text(line_start, cursor, False)
 
-        if m := re.match(r"^(\s*)(\d+)\.\s+(.*)$", line_text):
+        # Cheap prefix check before running either pattern
+        first = line_text.lstrip()[:1]
+        if not first.isdigit() and first not in ("-", "*", "+"):
+            return False
+
+        if first.isdigit() and (m := _NUM_LIST.match(line_text)):
             indent, num, content = m.groups()
             if content.strip():
                 self.buffer.insert_at_cursor(f"\n{indent}{int(num)+1}. ")
@@ -785,7 +1125,7 @@ class MemoEditView(ViewBase):
             self.buffer.delete(line_start, cursor)
             return False
 
-        if m := re.match(r"^(\s*)([-*+])\s+(.*)$", line_text):
+        if m := _BUL_LIST.match(line_text):
             indent, marker, content = m.groups()
             if content.strip():
                 self.buffer.insert_at_cursor(f"\n{indent}{marker} ")
@@ -2,80 +2,190 @@
 # GitHub-style activity heatmap for current month
 
 import calendar
-from collections import defaultdict
-from datetime import datetime
+import functools
+from collections import Counter
+from datetime import date
 
-from gi.repository import Gtk, Pango, PangoCairo
+import cairo
+from gi.repository import GLib, Gtk, Pango, PangoCairo
+
+from ..utils import async_executor
+
+
+@functools.lru_cache(maxsize=16)
+def _font(size, weight):
+    """Shared font description; callers must not mutate the result"""
+    font = Pango.FontDescription()
+    font.set_size(size * Pango.SCALE)
+    font.set_weight(weight)
+    return font
 
 
 class MemoHeatmap(Gtk.DrawingArea):
     """Calendar heatmap showing memo activity"""
 
+    __gtype_name__ = "MemoHeatmap"
+
     # Colors (RGBA)
     COLOR_EMPTY = (0.6, 0.6, 0.6, 0.4)
     COLOR_LOW = (0.68, 0.87, 0.68, 1.0)  # 1-3 memos
     COLOR_MEDIUM = (0.15, 0.64, 0.41, 1.0)  # 4-10 memos
     COLOR_HIGH = (0.85, 0.65, 0.13, 1.0)  # 10+ memos
 
+    # (background, text) per count bucket, see _bucket
+    COLOR_TABLE = (
+        (COLOR_EMPTY, (0.5, 0.5, 0.5, 1.0)),
+        (COLOR_LOW, (0.2, 0.4, 0.2, 1.0)),
+        (COLOR_MEDIUM, (1.0, 1.0, 1.0, 1.0)),
+        (COLOR_HIGH, (1.0, 1.0, 1.0, 1.0)),
+    )
+
     def __init__(self):
         super().__init__()
         self.set_hexpand(True)
         self.set_vexpand(False)
         self.set_size_request(-1, 300)
         self.set_draw_func(self._draw)
+        self.connect("realize", self._reset_layout)
+        self.connect("notify::scale-factor", self._reset_layout)
 
-        self.memo_counts = defaultdict(int)
-        self.current_month = datetime.now().month
-        self.current_year = datetime.now().year
+        self.memo_counts = Counter()
+        self._counts_token = 0
+        today = date.today()
+        self.current_month = today.month
+        self.current_year = today.year
         self._last_height = 300
+        self._last_resize_frame = None
+        self._redraw_pending = False
+
+        # Pango layout reused across paints (built on realize)
+        self._layout = None
+        self._cell_font_size = None
+        self._text_extents = {}
+
+        # Month layout, recomputed when (year, month) changes
+        self._cached_month_key = None
+        self._num_days = 0
+        self._first_weekday = 0
+        self._rows = 0
+
+        # (row, col, count, bucket) per day, rebuilt when data or month changes
+        self._cell_plan = []
+        self._plan_month = None
+        self._plan_dirty = True
+
+        # Rounded cell outline at the origin, keyed by (size, radius)
+        self._cell_path = None
+        self._cell_path_key = None
+
+        # Last rendered frame, reused while size, data and month are unchanged
+        self._data_version = 0
+        self._surface = None
+        self._surface_key = None
 
     # -------------------------------------------------------------------------
     # DATA
     # -------------------------------------------------------------------------
 
     def set_memos(self, memos):
-        """Count memos by date"""
-        self.memo_counts.clear()
-
-        for memo in memos:
-            create_time = memo.get("createTime", "")
-            if not create_time:
-                continue
-            try:
-                dt = datetime.fromisoformat(create_time.replace("Z", "+00:00"))
-                self.memo_counts[dt.date()] += 1
-            except (ValueError, AttributeError):
-                pass
+        """Count memos by date on a worker thread, then redraw"""
+        self._counts_token += 1
+        async_executor.submit_background(
+            self._count_worker, list(memos), self._counts_token
+        )
+
+    def _count_worker(self, memos, token):
+        """Key counts by the YYYY-MM-DD prefix of createTime (runs off the main thread)"""
+        counts = Counter(m["createTime"][:10] for m in memos if m.get("createTime"))
+        GLib.idle_add(self._apply_counts, counts, token)
 
+    def _apply_counts(self, counts, token):
+        """Install counts from the latest set_memos call; jobs may finish out of order"""
+        if token != self._counts_token:
+            return False
+        self.memo_counts = counts
+        self._plan_dirty = True
+        self._data_version += 1
+        self._schedule_redraw()
+        return False
+
+    def _schedule_redraw(self):
+        """Coalesce redraw requests into one idle callback"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            GLib.idle_add(self._flush_redraw)
+
+    def _flush_redraw(self):
+        """Run the pending redraw"""
+        self._redraw_pending = False
         self.queue_draw()
+        return False
+
+    def _rebuild_plan(self):
+        """Resolve grid position and count for each day of the month"""
+        year, month = self.current_year, self.current_month
+        self._ensure_month_meta()
+
+        plan = []
+        for day in range(1, self._num_days + 1):
+            pos = self._first_weekday + day - 1
+            count = self.memo_counts.get(f"{year:04d}-{month:02d}-{day:02d}", 0)
+            plan.append((pos // 7, pos % 7, count, self._bucket(count)))
+
+        self._cell_plan = plan
+        self._plan_month = (year, month)
+        self._plan_dirty = False
+
+    def _ensure_month_meta(self):
+        """Cache day count, first weekday and row count for the current month"""
+        key = (self.current_year, self.current_month)
+        if key == self._cached_month_key:
+            return
+        self._first_weekday, self._num_days = calendar.monthrange(*key)
+        self._rows = (self._num_days + self._first_weekday) // 7 + 1
+        self._cached_month_key = key
+
+    def _reset_layout(self, *args):
+        """Capture the Pango context and drop measurements tied to the old one"""
+        self._layout = Pango.Layout(self.get_pango_context())
+        self._cell_font_size = None
+        self._text_extents.clear()
+        self._surface_key = None
 
     # -------------------------------------------------------------------------
     # COLORS
     # -------------------------------------------------------------------------
 
-    def _get_cell_color(self, count):
-        """Background color based on count"""
+    @staticmethod
+    def _bucket(count):
+        """Index into COLOR_TABLE for a memo count"""
         if count == 0:
-            return self.COLOR_EMPTY
+            return 0
         if count <= 3:
-            return self.COLOR_LOW
+            return 1
         if count <= 10:
-            return self.COLOR_MEDIUM
-        return self.COLOR_HIGH
-
-    def _get_text_color(self, count):
-        """Text color for contrast"""
-        if count == 0:
-            return (0.5, 0.5, 0.5, 1.0)
-        if count <= 3:
-            return (0.2, 0.4, 0.2, 1.0)
-        return (1.0, 1.0, 1.0, 1.0)
+            return 2
+        return 3
 
     # -------------------------------------------------------------------------
     # DRAWING
     # -------------------------------------------------------------------------
 
     def _draw(self, area, cr, width, height):
+        """Paint the heatmap, re-rendering only when its inputs changed"""
+        key = (width, height, self._data_version, self.current_year, self.current_month)
+        if key != self._surface_key:
+            scale = self.get_scale_factor()
+            surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width * scale, height * scale)
+            surface.set_device_scale(scale, scale)
+            self._render(cairo.Context(surface), width)
+            self._surface = surface
+            self._surface_key = key
+
+        cr.set_source_surface(self._surface, 0, 0)
+        cr.paint()
+
+    def _render(self, cr, width):
         """Render the heatmap"""
         cols = 7
         cell_gap = 9
@@ -88,73 +198,87 @@ class MemoHeatmap(Gtk.DrawingArea):
         x_offset = (width - grid_width) / 2
 
         # Month info
-        num_days = calendar.monthrange(self.current_year, self.current_month)[1]
-        first_day = datetime(self.current_year, self.current_month, 1)
-        first_weekday = first_day.weekday()
-        rows = (num_days + first_weekday) // 7 + 1
+        self._ensure_month_meta()
+        rows = self._rows
 
         # Resize if needed
         grid_height = rows * cell_size + (rows - 1) * cell_gap
         required_height = header_height + grid_height + 20
-        if abs(required_height - self._last_height) > 10:
+        clock = self.get_frame_clock()
+        frame = clock.get_frame_counter() if clock else None
+        same_frame = frame is not None and frame == self._last_resize_frame
+        if abs(required_height - self._last_height) > 10 and not same_frame:
+            # set_size_request queues the resize itself
             self._last_height = required_height
+            self._last_resize_frame = frame
             self.set_size_request(-1, int(required_height))
-            self.queue_resize()
 
         # Pango setup
-        layout = Pango.Layout(self.get_pango_context())
-        font = Pango.FontDescription()
+        if self._layout is None:
+            self._reset_layout()
+        layout = self._layout
 
         # Month header
-        font.set_size(18 * Pango.SCALE)
-        font.set_weight(Pango.Weight.MEDIUM)
-        layout.set_font_description(font)
+        layout.set_font_description(_font(18, Pango.Weight.MEDIUM))
         layout.set_text("This month's activity", -1)
         cr.set_source_rgba(0.5, 0.5, 0.5, 1.0)
         cr.move_to(x_offset, 10)
         PangoCairo.show_layout(cr, layout)
 
-        # Cell font
+        # Cell font (re-measure counts only when the size changes)
         cell_font_size = max(10, min(16, int(cell_size / 3)))
-        font.set_size(cell_font_size * Pango.SCALE)
-        font.set_weight(Pango.Weight.MEDIUM)
-        layout.set_font_description(font)
+        if cell_font_size != self._cell_font_size:
+            self._cell_font_size = cell_font_size
+            self._text_extents.clear()
+        layout.set_font_description(_font(cell_font_size, Pango.Weight.MEDIUM))
 
         # Draw cells
+        if self._plan_dirty or self._plan_month != (self.current_year, self.current_month):
+            self._rebuild_plan()
+
+        path_key = (round(cell_size, 1), cell_radius)
+        if path_key != self._cell_path_key:
+            cr.new_path()
+            self._draw_rounded_rect(cr, 0, 0, cell_size, cell_size, cell_radius)
+            self._cell_path = cr.copy_path()
+            self._cell_path_key = path_key
+            cr.new_path()
+
         y_offset = header_height
-        day = 1
-
-        for row in range(rows):
-            for col in range(cols):
-                # Skip empty cells before first day
-                if row == 0 and col < first_weekday:
-                    continue
-                if day > num_days:
-                    break
-
-                date = datetime(self.current_year, self.current_month, day).date()
-                count = self.memo_counts.get(date, 0)
-
-                x = x_offset + col * (cell_size + cell_gap)
-                y = y_offset + row * (cell_size + cell_gap)
-
-                # Cell background
-                cr.set_source_rgba(*self._get_cell_color(count))
-                self._draw_rounded_rect(cr, x, y, cell_size, cell_size, cell_radius)
-                cr.fill()
-
-                # Cell count (only if > 0)
-                if count > 0:
-                    text = str(count) if count < 100 else "99+"
-                    layout.set_text(text, -1)
-                    _, logical = layout.get_pixel_extents()
-                    tx = x + (cell_size - logical.width) / 2
-                    ty = y + (cell_size - logical.height) / 2
-                    cr.set_source_rgba(*self._get_text_color(count))
-                    cr.move_to(tx, ty)
-                    PangoCairo.show_layout(cr, layout)
-
-                day += 1
+
+        # Bucket cells by background color so each color is one fill
+        buckets = {}
+        labels = []
+        for row, col, count, bucket in self._cell_plan:
+            x = x_offset + col * (cell_size + cell_gap)
+            y = y_offset + row * (cell_size + cell_gap)
+            buckets.setdefault(bucket, []).append((x, y))
+            if count > 0:
+                labels.append((x, y, count, bucket))
+
+        # Cell backgrounds
+        for bucket, positions in buckets.items():
+            cr.set_source_rgba(*self.COLOR_TABLE[bucket][0])
+            for x, y in positions:
+                cr.save()
+                cr.translate(x, y)
+                cr.append_path(self._cell_path)
+                cr.restore()
+            cr.fill()
+
+        # Cell counts (only if > 0)
+        for x, y, count, bucket in labels:
+            text = str(count) if count < 100 else "99+"
+            layout.set_text(text, -1)
+            extents = self._text_extents.get(text)
+            if extents is None:
+                _, logical = layout.get_pixel_extents()
+                extents = self._text_extents[text] = (logical.width, logical.height)
+            tx = x + (cell_size - extents[0]) / 2
+            ty = y + (cell_size - extents[1]) / 2
+            cr.set_source_rgba(*self.COLOR_TABLE[bucket][1])
+            cr.move_to(tx, ty)
+            PangoCairo.show_layout(cr, layout)
 
     def _draw_rounded_rect(self, cr, x, y, w, h, r):
         """Draw rounded rectangle path"""
@@ -1,20 +1,35 @@
 # ui/memo_loader.py
 # Memo list loader: pagination, month grouping, row click handling
 
-import threading
+import calendar
+import functools
+import re
 from collections import OrderedDict
-from datetime import datetime
 
-from gi.repository import GLib, Gtk
+from gi.repository import Gio, GLib, Gtk
 
-from .memo_heatmap import MemoHeatmap
-from .memo_row import MemoRow
+from ..utils import async_executor
+from .memo_row import MemoItem, MemoRow
 from .view_base import ViewBase
 
+# YYYY-MM prefix of an ISO createTime
+_ISO_MONTH = re.compile(r"(\d{4})-(0[1-9]|1[0-2])")
+
+
+@functools.lru_cache(maxsize=None)
+def _month_label(prefix):
+    """Format a 'YYYY-MM' prefix as 'Month YYYY'"""
+    m = _ISO_MONTH.match(prefix)
+    if not m:
+        return "Unknown"
+    return f"{calendar.month_name[int(m.group(2))]} {m.group(1)}"
+
 
 class MemoLoader(ViewBase):
     """Load, group, and paginate memos"""
 
+    PAGE_SIZE = 50  # memos per page, matching MemosAPI.get_memos
+
     def __init__(self, api, container):
         super().__init__()
         self.api = api
@@ -26,10 +41,22 @@ class MemoLoader(ViewBase):
         self.on_memo_clicked = None
         self._listbox_handlers = []
 
+        # Bumped per reload; page fetches started before it are dropped
+        self._generation = 0
+
+        # (header, listbox) pairs kept across reloads
+        self._section_pool = []
+
+        # (header, listbox) pairs currently added to the container
+        self._removable_children = []
+
     def cleanup(self):
         """Clean up resources before destroying"""
         # Call parent cleanup
         super().cleanup()
+
+        # Fetches still in flight are dropped when they land
+        self._generation += 1
         
         # Clear callbacks to break circular references
         self.on_reload_complete = None
@@ -38,8 +65,10 @@ class MemoLoader(ViewBase):
         # Clear API reference
         self.api = None
         
-        # Clear month sections
+        # Clear month sections and pooled widgets
         self.month_sections.clear()
+        self._removable_children.clear()
+        self._section_pool.clear()
 
     # -------------------------------------------------------------------------
     # LOAD
@@ -47,27 +76,50 @@ class MemoLoader(ViewBase):
 
     def load_initial(self, memos):
         """Clear and load initial memos"""
+        self._generation += 1  # pages still loading belong to the old list
+        self.loading_more = False
         self._clear_container()
         self.month_sections = {}
 
         for month, month_memos in self._group_by_month(memos).items():
             self._create_section(month, month_memos)
 
-    def load_more(self, callback):
-        """Load next page"""
+    def load_more(self, callback, pages=1):
+        """Load the next pages back to back and add them in one pass"""
         if self.loading_more or not self.page_token:
             return
 
         self.loading_more = True
+        generation = self._generation
+        api = self.api
 
         def worker():
-            success, memos, token = self.api.get_memos(page_token=self.page_token)
-            GLib.idle_add(self._on_load_more_complete, success, memos, token, callback)
-
-        threading.Thread(target=worker, daemon=True).start()
-
-    def _on_load_more_complete(self, success, memos, token, callback):
+            # A page token carries its own page size, so each page is its own request
+            token = self.page_token
+            memos = []
+            success = False
+            for _ in range(pages):
+                ok, page, next_token = api.get_memos(
+                    page_size=self.PAGE_SIZE, page_token=token
+                )
+                if not ok:
+                    break
+                success = True
+                memos.extend(page)
+                token = next_token
+                if not token:
+                    break
+            GLib.idle_add(
+                self._on_load_more_complete, generation, success, memos, token, callback
+            )
+
+        async_executor.submit_background(worker)
+
+    def _on_load_more_complete(self, generation, success, memos, token, callback):
         """Handle load_more result"""
+        if generation != self._generation:
+            return False
+
         count = 0
         has_more = False
 
@@ -77,13 +129,12 @@ class MemoLoader(ViewBase):
 
             for month, month_memos in self._group_by_month(memos).items():
                 if month in self.month_sections:
-                    # Append to existing section
-                    listbox = self.month_sections[month]
-                    for memo in month_memos:
-                        listbox.append(
-                            MemoRow.create(memo, self.api, MemoRow.fetch_attachments)
-                        )
-                        count += 1
+                    # Append to existing section in one model change
+                    store = self.month_sections[month]
+                    store.splice(
+                        store.get_n_items(), 0, [MemoItem(m) for m in month_memos]
+                    )
+                    count += len(month_memos)
                 else:
                     # New section
                     self._create_section(month, month_memos)
@@ -94,20 +145,25 @@ class MemoLoader(ViewBase):
         self.loading_more = False
         if callback:
             callback(count, has_more)
+        return False
 
     def reload_from_start(self):
         """Reload all memos"""
+        self._generation += 1  # pages still loading belong to the old list
+        self.loading_more = False
+        generation = self._generation
+        api = self.api
 
         def worker():
-            success, memos, token = self.api.get_memos()
-            GLib.idle_add(self._on_reload_complete, success, memos, token)
+            success, memos, token = api.get_memos()
+            GLib.idle_add(self._on_reload_complete, generation, success, memos, token)
 
-        threading.Thread(target=worker, daemon=True).start()
+        async_executor.submit(worker)
 
-    def _on_reload_complete(self, success, memos, token):
+    def _on_reload_complete(self, generation, success, memos, token):
         """Handle reload result"""
-        if not success:
-            return
+        if generation != self._generation or not success:
+            return False
 
         self.page_token = token
         self._clear_container()
@@ -118,65 +174,75 @@ class MemoLoader(ViewBase):
 
         if self.on_reload_complete:
             self.on_reload_complete(len(memos))
+        return False
 
     # -------------------------------------------------------------------------
     # SECTIONS
     # -------------------------------------------------------------------------
 
     def _create_section(self, month, memos):
-        """Create month header + listbox"""
-        # Header
-        header = Gtk.Label(label=month)
-        header.set_xalign(0)
-        header.set_margin_top(24)
-        header.set_margin_bottom(12)
-        header.set_margin_start(20)
-        header.set_margin_end(20)
-        header.add_css_class("title-3")
-
-        # List
-        listbox = Gtk.ListBox()
-        listbox.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        listbox.add_css_class("boxed-list")
-        handler_id = listbox.connect("row-activated", self._on_row_activated)
-        self.add_signal(listbox, handler_id)
-
-        for memo in memos:
-            listbox.append(MemoRow.create(memo, self.api, MemoRow.fetch_attachments))
+        """Create month header + model-backed listbox, reusing pooled widgets"""
+        if self._section_pool:
+            header, listbox = self._section_pool.pop()
+        else:
+            header, listbox = self._new_section_widgets()
+        header.set_label(month)
+
+        # Rows are built while the listbox is still unparented, so filling it
+        # costs no layout work in the container; it is attached once below
+        for widget in (header, listbox):
+            parent = widget.get_parent()
+            if parent is not None:
+                parent.remove(widget)
+        store = Gio.ListStore.new(MemoItem)
+        listbox.bind_model(store, self._create_row)
+        store.splice(0, 0, [MemoItem(m) for m in memos])
 
         self.container.append(header)
         self.container.append(listbox)
-        self.month_sections[month] = listbox
+        self._removable_children.append((header, listbox))
+        self.month_sections[month] = store
+
+    def _new_section_widgets(self):
+        """Instantiate month header + listbox from the section template"""
+        builder = Gtk.Builder.new_from_resource(
+            "/org/quasars/memories/resources/memo_section.ui"
+        )
+        header = builder.get_object("header")
+        listbox = builder.get_object("listbox")
+        handler_id = listbox.connect("row-activated", self._on_row_activated)
+        self.add_signal(listbox, handler_id)
+        return header, listbox
+
+    def _create_row(self, item):
+        """Build row for a MemoItem"""
+        return MemoRow.create(item.memo, self.api, MemoRow.fetch_attachments)
 
     def _group_by_month(self, memos):
         """Group memos by pinned status, then by month, sorted by updateTime"""
         pinned = []
-        unpinned = OrderedDict()
+        by_prefix = OrderedDict()
 
+        # Bucket on the raw YYYY-MM prefix; labels are formatted per bucket
         for memo in memos:
             if memo.get("pinned"):
                 pinned.append(memo)
             else:
-                created_ts = memo.get("createTime", "")
-                if created_ts:
-                    try:
-                        dt = datetime.fromisoformat(created_ts.replace("Z", "+00:00"))
-                        month_year = dt.strftime("%B %Y")
-                    except (ValueError, AttributeError):
-                        month_year = "Unknown"
-                else:
-                    month_year = "Unknown"
+                by_prefix.setdefault((memo.get("createTime") or "")[:7], []).append(memo)
+
+        unpinned = OrderedDict()
+        for prefix, month_memos in by_prefix.items():
+            unpinned.setdefault(_month_label(prefix), []).extend(month_memos)
 
-                if month_year not in unpinned:
-                    unpinned[month_year] = []
-                unpinned[month_year].append(memo)
+        # Sort pinned by most recently updated (the server may send null times)
+        def recency(m):
+            return m.get("updateTime") or m.get("createTime") or ""
 
-        # Sort pinned by most recently updated
-        pinned.sort(key=lambda m: m.get("updateTime", m.get("createTime", "")), reverse=True)
+        pinned.sort(key=recency, reverse=True)
 
         # Sort each month's memos by most recently updated
         for month_memos in unpinned.values():
-            month_memos.sort(key=lambda m: m.get("updateTime", m.get("createTime", "")), reverse=True)
+            month_memos.sort(key=recency, reverse=True)
 
         # Return pinned first, then by month
         result = OrderedDict()
@@ -190,13 +256,18 @@ class MemoLoader(ViewBase):
     # -------------------------------------------------------------------------
 
     def _clear_container(self):
-        """Remove all children except heatmap"""
-        child = self.container.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            if not isinstance(child, MemoHeatmap):
-                self.container.remove(child)
-            child = next_child
+        """Remove section widgets (never the heatmap), pooling them"""
+        for header, listbox in self._removable_children:
+            # Search results may already have emptied the container
+            if header.get_parent() is self.container:
+                self.container.remove(header)
+            if listbox.get_parent() is self.container:
+                self.container.remove(listbox)
+            listbox.bind_model(None, None)
+            header.set_visible(True)  # may have been hidden behind search results
+            listbox.set_visible(True)
+            self._section_pool.append((header, listbox))
+        self._removable_children.clear()
 
     def _on_row_activated(self, listbox, row):
         """Handle row click"""
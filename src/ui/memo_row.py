@@ -1,21 +1,126 @@
 # ui/memo_row.py
 # Memo list row: content preview, thumbnail stack, async image loading
 
-import contextlib
+import hashlib
+import logging
+import os
+import shutil
+import struct
+import tempfile
 import threading
+from collections import OrderedDict
 from datetime import datetime
 
 import requests
-from gi.repository import Gdk, GdkPixbuf, GLib, Gtk, Pango
+from requests.adapters import HTTPAdapter
+from gi.repository import Gdk, GdkPixbuf, Gio, GLib, GObject, Gtk
 
+from ..utils import async_executor
 from ..utils.markdown import MarkdownUtils
 
+log = logging.getLogger(__name__)
+
+# Keep-alive connections for attachment/thumbnail fetches on the shared pool
+_SESSION = requests.Session()
+
+# One socket per worker at most; a single adapter serves both schemes
+_ADAPTER = HTTPAdapter(
+    pool_connections=4, pool_maxsize=async_executor.BACKGROUND_WORKERS, max_retries=1
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# Decoded thumbnails by sha1(full url + version): in memory (LRU) and as raw scaled pixels
+# on disk (LRU by mtime, purged on disconnect)
+_TEX_CACHE = OrderedDict()
+_TEX_CACHE_SIZE = 256
+_TEX_LOCK = threading.Lock()
+_THUMB_DIR = os.path.join(GLib.get_user_cache_dir(), "memories", "thumbs")
+_THUMB_HEADER = struct.Struct("<4I")  # width, height, rowstride, has_alpha
+_THUMB_DISK_CAP = 64 * 1024 * 1024  # bytes; trimmed to 3/4 of this when exceeded
+_DISK_LOCK = threading.Lock()
+
+# Preview markup and date line by (memo name, updateTime), so API payloads stay untouched;
+# only touched on the main loop
+_PREVIEW_CACHE = OrderedDict()
+_PREVIEW_CACHE_SIZE = 1024
+
+
+class MemoItem(GObject.Object):
+    """List model item wrapping a memo dict"""
+
+    __gtype_name__ = "MemoItem"
+
+    def __init__(self, memo):
+        super().__init__()
+        self.memo = memo
+
+
+class _ThumbViewport:
+    """Starts and cancels thumbnail fetches as rows near or leave a scrolled window's view"""
+
+    MARGIN = 400  # px outside the visible area that still counts as on screen
+
+    def __init__(self, scrolled):
+        self.scrolled = scrolled
+        self.boxes = set()
+        self._check_pending = False
+        adjustment = scrolled.get_vadjustment()
+        adjustment.connect("value-changed", self._queue_check)
+        adjustment.connect("changed", self._queue_check)
+
+    @staticmethod
+    def of(widget):
+        """Tracker for the scrolled window around widget, created on first use"""
+        scrolled = widget.get_ancestor(Gtk.ScrolledWindow)
+        if scrolled is None:
+            return None
+        viewport = getattr(scrolled, "thumb_viewport", None)
+        if viewport is None:
+            viewport = scrolled.thumb_viewport = _ThumbViewport(scrolled)
+        return viewport
+
+    def track(self, box):
+        """Watch a mapped thumbnail until its fetch has finished"""
+        self.boxes.add(box)
+        self._queue_check()
+
+    def untrack(self, box):
+        self.boxes.discard(box)
+
+    def _queue_check(self, *args):
+        """Check once per main-loop pass, after layout has settled"""
+        if not self._check_pending:
+            self._check_pending = True
+            GLib.idle_add(self._check)
+
+    def _check(self):
+        """Start fetches for rows in view and cancel queued ones that have left it"""
+        self._check_pending = False
+        scrolled = self.scrolled
+        low, high = -self.MARGIN, scrolled.get_height() + self.MARGIN
+        for box in list(self.boxes):
+            ok, bounds = box.compute_bounds(scrolled)
+            visible = ok and low < bounds.origin.y + bounds.size.height and bounds.origin.y < high
+            if MemoRow._update_thumb(box, visible):
+                self.boxes.discard(box)
+        return False
+
 
 class MemoRow:
     """Factory for memo list rows"""
 
     THUMB_SIZE = 160
 
+    # Thumbnail request headers, cached per (headers object, token)
+    _image_headers = None
+    _image_headers_src = None
+
+    # Bytes in _THUMB_DIR (None until first counted), and a counter bumped on
+    # purge so downloads started before it don't repopulate the cache
+    _disk_usage = None
+    _cache_epoch = 0
+
     # -------------------------------------------------------------------------
     # CREATE ROW
     # -------------------------------------------------------------------------
@@ -23,31 +128,20 @@ class MemoRow:
     @staticmethod
     def create(memo, api, fetch_callback):
         """Build a memo row with optional thumbnail"""
-        row = Gtk.ListBoxRow()
-        row.set_activatable(True)
+        builder = Gtk.Builder.new_from_resource(
+            "/org/quasars/memories/resources/memo_row.ui"
+        )
+        row = builder.get_object("row")
         row.memo_data = memo
 
-        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        box.set_margin_top(12)
-        box.set_margin_bottom(12)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
-
         # Thumbnail
         images = MemoRow._get_image_attachments(memo)
         if images:
             thumb = MemoRow._create_thumbnail(memo, api, fetch_callback, images)
-            box.append(thumb)
+            builder.get_object("box").prepend(thumb)
 
         # Content
-        box.append(MemoRow._create_content(memo))
-
-        # Arrow
-        arrow = Gtk.Image.new_from_icon_name("go-next-symbolic")
-        arrow.set_valign(Gtk.Align.CENTER)
-        box.append(arrow)
-
-        row.set_child(box)
+        MemoRow._fill_content(builder, memo)
         return row
 
     # -------------------------------------------------------------------------
@@ -57,66 +151,55 @@ class MemoRow:
     @staticmethod
     def _get_image_attachments(memo):
         """Extract image attachments from memo"""
-        attachments = memo.get("resources", []) or memo.get("attachments", [])
-        return [a for a in attachments if a.get("type", "").startswith("image/")]
+        attachments = memo.get("resources")
+        if not attachments:
+            attachments = memo.get("attachments") or ()
+        return [a for a in attachments if (a.get("type") or "")[:6] == "image/"]
 
     @staticmethod
-    def _create_content(memo):
-        """Create text content box"""
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        box.set_hexpand(True)
-
-        # Text preview with markdown
-        content = memo.get("content", "")[:200]
-        if len(memo.get("content", "")) > 200:
-            content += "..."
-
-        # Convert markdown to Pango markup
-        markup = MarkdownUtils.to_pango_markup(content)
-
-        label = Gtk.Label()
-        label.set_markup(markup)
-        label.set_xalign(0)
-        label.set_wrap(True)
-        label.set_wrap_mode(Pango.WrapMode.WORD_CHAR)
-        label.set_max_width_chars(50)
-        box.append(label)
+    def _fill_content(builder, memo):
+        """Fill the preview label and date line of a row template"""
+        # Text preview and date line, converted once per memo version
+        key = (memo.get("name"), memo.get("updateTime"))
+        cached = _PREVIEW_CACHE.get(key)
+        if cached is not None:
+            _PREVIEW_CACHE.move_to_end(key)
+            markup, date_str = cached
+        else:
+            content = memo.get("content", "")
+            if len(content) > 200:
+                content = content[:200] + "..."
+
+            # Convert markdown to Pango markup
+            markup = MarkdownUtils.to_pango_markup(content)
+
+            date_str = ""
+            create_time = memo.get("createTime", "")
+            if create_time:
+                try:
+                    dt = datetime.fromisoformat(create_time)
+                    date_str = dt.strftime("%B %d, %Y at %I:%M %p")
+                except (ValueError, AttributeError):
+                    pass
+
+            # Unsaved memos have no name to key on
+            if key[0]:
+                _PREVIEW_CACHE[key] = (markup, date_str)
+                if len(_PREVIEW_CACHE) > _PREVIEW_CACHE_SIZE:
+                    _PREVIEW_CACHE.popitem(last=False)
+
+        builder.get_object("preview").set_markup(markup)
 
         # Date with visibility icons
-        create_time = memo.get("createTime", "")
-        if create_time:
-            try:
-                dt = datetime.fromisoformat(create_time.replace("Z", "+00:00"))
-                date_str = dt.strftime("%B %d, %Y at %I:%M %p")
-                
-                # Create horizontal box for date and icons
-                date_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-                date_box.set_halign(Gtk.Align.START)
-                
-                date_label = Gtk.Label(label=date_str)
-                date_label.set_xalign(0)
-                date_label.add_css_class("caption")
-                date_label.add_css_class("dim-label")
-                date_box.append(date_label)
-                
-                # Add visibility icon
-                visibility = memo.get("visibility", "PUBLIC")
-                if visibility == "PRIVATE":
-                    private_icon = Gtk.Image.new_from_icon_name("system-lock-screen-symbolic")
-                    private_icon.set_tooltip_text("Private")
-                    private_icon.add_css_class("dim-label")
-                    date_box.append(private_icon)
-                elif visibility == "PROTECTED":
-                    protected_icon = Gtk.Image.new_from_icon_name("dialog-password-symbolic")
-                    protected_icon.set_tooltip_text("Protected")
-                    protected_icon.add_css_class("dim-label")
-                    date_box.append(protected_icon)
-                
-                box.append(date_box)
-            except (ValueError, AttributeError):
-                pass
 
-        return box
+        if date_str:
+            builder.get_object("date_label").set_label(date_str)
+            visibility = memo.get("visibility", "PUBLIC")
+            if visibility == "PRIVATE":
+                builder.get_object("private_icon").set_visible(True)
+            elif visibility == "PROTECTED":
+                builder.get_object("protected_icon").set_visible(True)
+            builder.get_object("date_box").set_visible(True)
 
     @staticmethod
     def _create_thumbnail(memo, api, fetch_callback, images):
@@ -157,16 +240,56 @@ class MemoRow:
             badge_box.append(badge)
             overlay.add_overlay(badge_box)
 
-        fetch_callback(base_box, base_picture, memo.get("name", ""), api)
+        # Defer the fetch until the row nears the viewport; cancel if it leaves first
+        base_box.thumb_start = lambda: fetch_callback(
+            base_box, base_picture, memo.get("name", ""), api
+        )
+        base_box.thumb_future = None
+        base_box.thumb_visible = False
+        base_box.thumb_parked = None
+        base_box.thumb_viewport = None
+
+        def on_map(widget):
+            widget.thumb_viewport = _ThumbViewport.of(widget)
+            if widget.thumb_viewport is not None:
+                widget.thumb_viewport.track(widget)
+            else:
+                MemoRow._update_thumb(widget, True)
+
+        def on_unmap(widget):
+            if widget.thumb_viewport is not None:
+                widget.thumb_viewport.untrack(widget)
+                widget.thumb_viewport = None
+            MemoRow._update_thumb(widget, False)
+
+        base_box.connect("map", on_map)
+        base_box.connect("unmap", on_unmap)
         return overlay
 
+    @staticmethod
+    def _update_thumb(box, visible):
+        """Start, resume or cancel a row's thumbnail as it enters or leaves view; True once done"""
+        box.thumb_visible = visible
+        future = box.thumb_future
+        if visible:
+            if box.thumb_parked is not None:
+                parked, box.thumb_parked = box.thumb_parked, None
+                async_executor.submit_background(
+                    MemoRow._decode_thumbnail, box, *parked
+                )
+            elif future is None:
+                box.thumb_future = future = box.thumb_start()
+        elif future is not None and future.cancel():
+            box.thumb_future = future = None
+        return box.thumb_parked is None and future is not None and future.done()
+
     # -------------------------------------------------------------------------
     # ASYNC IMAGE LOADING
     # -------------------------------------------------------------------------
 
     @staticmethod
     def fetch_attachments(image_box, placeholder, memo_name, api):
-        """Fetch first attachment and load thumbnail"""
+        """Fetch first attachment and load thumbnail; returns the pending future"""
 
         def worker():
             attachments = api.get_memo_attachments(memo_name)
@@ -181,85 +304,275 @@ class MemoRow:
             filename = first.get("filename", "")
             if name and filename:
                 url = f"/file/{name}/{filename}"
-                GLib.idle_add(MemoRow._load_thumbnail, image_box, placeholder, url, api)
+                # A re-uploaded attachment keeps its path but not its timestamps/size
+                version = "{}:{}".format(
+                    first.get("updateTime") or first.get("createTime") or "",
+                    first.get("size", ""),
+                )
+                MemoRow._download_thumbnail(image_box, placeholder, url, api, version)
 
-        threading.Thread(target=worker, daemon=True).start()
+        return async_executor.submit_background(worker)
 
     @staticmethod
-    def _load_thumbnail(image_box, placeholder, url, api):
-        """Load image from URL"""
+    def _download_thumbnail(image_box, placeholder, url, api, version=""):
+        """Download and decode a thumbnail (runs on an I/O worker)"""
+        try:
+            epoch = MemoRow._cache_epoch
+            full_url = f"{api.base_url}{url}" if url.startswith("/") else url
+            key = hashlib.sha1(f"{full_url}\n{version}".encode()).hexdigest()
+            texture = MemoRow._cached_texture(key)
+            if texture is not None:
+                GLib.idle_add(MemoRow._attach_texture, image_box, placeholder, texture)
+                return
 
-        def worker():
-            try:
-                full_url = f"{api.base_url}{url}" if url.startswith("/") else url
-                print(f"[THUMB] Loading: {full_url}")
-
-                # Copy headers from API - works with both dict and session headers
-                headers = {}
-                if hasattr(api.headers, 'items'):
-                    headers.update(api.headers)
-                else:
-                    headers.update(dict(api.headers))
-                headers["Accept"] = "image/*"
-
-                r = requests.get(full_url, headers=headers, timeout=5)
-                print(
-                    f"[THUMB] Status: {r.status_code}, "
-                    f"Content-Type: {r.headers.get('Content-Type', 'none')}"
-                )
+            log.debug("[THUMB] Loading: %s", full_url)
 
-                if r.status_code != 200:
-                    print(f"[THUMB] Failed: {r.text[:200]}")
-                    return
+            headers = MemoRow._image_headers_for(api)
+            r = _SESSION.get(full_url, headers=headers, timeout=5)
+            log.debug(
+                "[THUMB] Status: %s, Content-Type: %s",
+                r.status_code, r.headers.get("Content-Type", "none"),
+            )
 
-                content_type = r.headers.get("Content-Type", "")
-                if "image" not in content_type:
-                    print(f"[THUMB] Not an image: {content_type}")
-                    return
+            if r.status_code != 200:
+                log.debug("[THUMB] Failed: HTTP %s", r.status_code)
+                return
 
-                print(f"[THUMB] Got {len(r.content)} bytes")
-                GLib.idle_add(MemoRow._set_thumbnail, image_box, placeholder, r.content)
-            except Exception as e:
-                print(f"[THUMB] Error: {e}")
+            content_type = r.headers.get("Content-Type", "")
+            if "image" not in content_type:
+                log.debug("[THUMB] Not an image: %s", content_type)
+                return
 
-        threading.Thread(target=worker, daemon=True).start()
+            log.debug("[THUMB] Got %d bytes", len(r.content))
+            if not getattr(image_box, "thumb_visible", True):
+                # Scrolled past while downloading: decode on the next map
+                GLib.idle_add(
+                    MemoRow._park_thumbnail, image_box, placeholder, key, r.content, epoch
+                )
+                return
+            MemoRow._decode_thumbnail(image_box, placeholder, key, r.content, epoch)
+        except Exception as e:
+            log.warning("[THUMB] Error: %s", e)
 
     @staticmethod
-    def _set_thumbnail(image_box, placeholder, data):
-        """Set thumbnail from image data"""
-        import os
-        import tempfile
+    def _image_headers_for(api):
+        """API headers plus Accept: image/*, rebuilt only when the auth source changes"""
+        src = (id(api.headers), api.token)
+        headers = MemoRow._image_headers
+        if headers is None or MemoRow._image_headers_src != src:
+            # Copy headers from API - works with both dict and session headers
+            headers = dict(api.headers)
+            headers["Accept"] = "image/*"
+            MemoRow._image_headers = headers
+            MemoRow._image_headers_src = src
+        return headers
 
-        fd = None
-        path = None
+    @staticmethod
+    def _decode_thumbnail(image_box, placeholder, key, data, epoch):
+        """Decode, cache and attach downloaded image data (runs on an I/O worker)"""
         try:
-            # Write to temp file
-            fd, path = tempfile.mkstemp(suffix=".png")
-            os.write(fd, data)
-            os.close(fd)
-            fd = None  # Mark as closed
-
-            # Load directly with GdkPixbuf (bypass glycin)
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                path, MemoRow.THUMB_SIZE, MemoRow.THUMB_SIZE, True
-            )
-
+            pixbuf = MemoRow._decode_to_pixbuf(data)
             texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-            picture = Gtk.Picture.new_for_paintable(texture)
-            picture.set_size_request(MemoRow.THUMB_SIZE, MemoRow.THUMB_SIZE)
-            picture.set_can_shrink(False)
-            picture.add_css_class("thumbnail")
-
-            image_box.remove(placeholder)
-            image_box.append(picture)
-            image_box.set_visible(True)
+            MemoRow._store_texture(key, texture, pixbuf, epoch)
+            GLib.idle_add(MemoRow._attach_texture, image_box, placeholder, texture)
         except Exception as e:
-            print(f"[THUMB] Set error: {e}")
-        finally:
-            # Clean up temp file in all cases
-            if fd is not None:
-                with contextlib.suppress(OSError):
-                    os.close(fd)
-            if path is not None:
-                with contextlib.suppress(OSError):
-                    os.unlink(path)
+            log.warning("[THUMB] Decode error: %s", e)
+
+    @staticmethod
+    def _park_thumbnail(image_box, placeholder, key, data, epoch):
+        """Hold downloaded bytes until the row is back in view"""
+        if image_box.thumb_visible:
+            async_executor.submit_background(
+                MemoRow._decode_thumbnail, image_box, placeholder, key, data, epoch
+            )
+            return False
+
+        # The tracker may have let go of the row when its fetch finished
+        image_box.thumb_parked = (placeholder, key, data, epoch)
+        if image_box.thumb_viewport is not None:
+            image_box.thumb_viewport.track(image_box)
+        return False
+
+    @staticmethod
+    def _decode_to_pixbuf(data):
+        """Decode image data into a thumbnail pixbuf (runs off the main thread)"""
+        if data[:2] == b"\xff\xd8":
+            # JPEG: decode in memory at thumbnail size
+            pixbuf = MemoRow._decode_jpeg(data)
+        else:
+            # Load directly with GdkPixbuf from memory (bypass glycin)
+            stream = Gio.MemoryInputStream.new_from_bytes(GLib.Bytes.new(data))
+            pixbuf = GdkPixbuf.Pixbuf.new_from_stream_at_scale(
+                stream, MemoRow.THUMB_SIZE, MemoRow.THUMB_SIZE, True, None
+            )
+
+        return pixbuf
+
+    @staticmethod
+    def _cached_texture(key):
+        """Look up a thumbnail in memory, then on disk"""
+        with _TEX_LOCK:
+            texture = _TEX_CACHE.get(key)
+            if texture is not None:
+                _TEX_CACHE.move_to_end(key)
+                return texture
+
+        path = os.path.join(_THUMB_DIR, f"{key}.rgb")
+        try:
+            with open(path, "rb") as f:
+                blob = f.read()
+        except OSError:
+            return None
+
+        texture = MemoRow._texture_from_blob(blob)
+        if texture is None:
+            log.warning("[THUMB] Bad cache entry %s", key)
+            with _DISK_LOCK:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            return None
+
+        try:
+            os.utime(path)  # mtime is the disk LRU order
+        except OSError:
+            pass
+        MemoRow._remember_texture(key, texture)
+        return texture
+
+    @staticmethod
+    def _texture_from_blob(blob):
+        """Build a memory texture from a cache entry, or None if it is malformed"""
+        # Raw pixels go straight into a memory texture, no image decoding
+        if len(blob) < _THUMB_HEADER.size:
+            return None
+        width, height, stride, alpha = _THUMB_HEADER.unpack_from(blob)
+        bpp = 4 if alpha else 3
+        if not width or not height or stride < width * bpp:
+            return None
+
+        # Same length GdkPixbuf reports: the last row carries no stride padding
+        if len(blob) - _THUMB_HEADER.size != (height - 1) * stride + width * bpp:
+            return None
+
+        fmt = Gdk.MemoryFormat.R8G8B8A8 if alpha else Gdk.MemoryFormat.R8G8B8
+        pixels = GLib.Bytes.new(blob[_THUMB_HEADER.size:])
+        try:
+            return Gdk.MemoryTexture.new(width, height, fmt, pixels, stride)
+        except (GLib.Error, TypeError):
+            return None
+
+    @staticmethod
+    def _store_texture(key, texture, pixbuf, epoch):
+        """Cache a decoded thumbnail in memory and its raw pixels on disk"""
+        if epoch != MemoRow._cache_epoch:
+            return  # purged since the download started
+        MemoRow._remember_texture(key, texture)
+        header = _THUMB_HEADER.pack(
+            pixbuf.get_width(), pixbuf.get_height(),
+            pixbuf.get_rowstride(), int(pixbuf.get_has_alpha()),
+        )
+        pixels = pixbuf.read_pixel_bytes().get_data()
+
+        with _DISK_LOCK:
+            if epoch != MemoRow._cache_epoch:
+                return
+            try:
+                # Private to the user, and written whole: readers never see a torn file
+                os.makedirs(_THUMB_DIR, mode=0o700, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=_THUMB_DIR, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(header)
+                        f.write(pixels)
+                    os.replace(tmp, os.path.join(_THUMB_DIR, f"{key}.rgb"))
+                except BaseException:
+                    os.unlink(tmp)
+                    raise
+            except OSError as e:
+                log.warning("[THUMB] Cache write error: %s", e)
+                return
+            MemoRow._account_disk_usage(len(header) + len(pixels))
+
+    @staticmethod
+    def _account_disk_usage(added):
+        """Add a written entry to the disk total, trimming past the cap (_DISK_LOCK held)"""
+        if MemoRow._disk_usage is None:
+            MemoRow._disk_usage = sum(size for _, size, _ in MemoRow._disk_entries())
+        else:
+            MemoRow._disk_usage += added
+        if MemoRow._disk_usage <= _THUMB_DISK_CAP:
+            return
+
+        # Least recently used first; stop once well under the cap
+        entries = sorted(MemoRow._disk_entries())
+        usage = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if usage <= _THUMB_DISK_CAP * 3 // 4:
+                break
+            try:
+                os.remove(path)
+                usage -= size
+            except OSError:
+                pass
+        MemoRow._disk_usage = usage
+
+    @staticmethod
+    def _disk_entries():
+        """(mtime, size, path) for every file in the thumbnail directory"""
+        entries = []
+        try:
+            with os.scandir(_THUMB_DIR) as it:
+                for entry in it:
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        except OSError:
+            pass
+        return entries
+
+    @staticmethod
+    def purge_thumbnail_cache():
+        """Forget every cached thumbnail, in memory and on disk"""
+        with _TEX_LOCK:
+            _TEX_CACHE.clear()
+        with _DISK_LOCK:
+            MemoRow._cache_epoch += 1
+            MemoRow._disk_usage = None
+            shutil.rmtree(_THUMB_DIR, ignore_errors=True)
+
+    @staticmethod
+    def _remember_texture(key, texture):
+        """Insert into the in-memory LRU, evicting the oldest entry"""
+        with _TEX_LOCK:
+            _TEX_CACHE[key] = texture
+            _TEX_CACHE.move_to_end(key)
+            if len(_TEX_CACHE) > _TEX_CACHE_SIZE:
+                _TEX_CACHE.popitem(last=False)
+
+    @staticmethod
+    def _attach_texture(image_box, placeholder, texture):
+        """Show a decoded texture in the placeholder picture"""
+        placeholder.set_paintable(texture)
+        placeholder.set_can_shrink(False)
+        image_box.set_visible(True)
+        return False
+
+    @staticmethod
+    def _decode_jpeg(data):
+        """Decode JPEG bytes with the jpeg loader, scaled during decode"""
+        loader = GdkPixbuf.PixbufLoader.new_with_type("jpeg")
+        loader.connect("size-prepared", MemoRow._on_size_prepared)
+        loader.write(data)
+        loader.close()
+        return loader.get_pixbuf()
+
+    @staticmethod
+    def _on_size_prepared(loader, width, height):
+        """Fit within THUMB_SIZE keeping the aspect ratio, as new_from_stream_at_scale does"""
+        size = MemoRow.THUMB_SIZE
+        scale = size / max(width, height)
+        loader.set_size(max(1, round(width * scale)), max(1, round(height * scale)))
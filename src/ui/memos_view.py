@@ -1,17 +1,22 @@
 # ui/memos_view.py
 # Memo list: heatmap, pagination, search
 
-from gi.repository import GLib, Gtk
+from gi.repository import Gio, GLib, Gtk
 
-from .memo_heatmap import MemoHeatmap
+from .memo_heatmap import MemoHeatmap  # noqa: F401 - registers the GType for memo_heatmap.ui
 from .memo_loader import MemoLoader
-from .memo_row import MemoRow
+from .memo_row import MemoItem, MemoRow
 from .view_base import ViewBase
 
 
 class MemosView(ViewBase):
     """Memo list with heatmap and search"""
 
+    SCROLL_INTERVAL_US = 16000  # ~one frame at 60 Hz
+    PREFETCH_DISTANCE = 800  # px from the bottom that starts loading
+    PREFETCH_DEPTH = 2  # pages fetched back to back per trigger
+    FAST_SCROLL = 3000  # px/s above which one extra page is fetched
+
     def __init__(self, container, scrolled_window, memo_count_label=None):
         super().__init__()
         self.container = container
@@ -22,6 +27,27 @@ class MemosView(ViewBase):
         self.loaded_memos = 0
         self.total_memos = 0
         self.is_searching = False
+        self._last_count_label = None
+        self._load_more_timeout = None
+        self._last_scroll_us = 0
+        self._scroll_trailing = None  # one-shot IDs, cleared when they fire
+        self._opacity_step = None  # heatmap opacity in 0.05 steps
+        self._last_scroll_value = 0.0
+        self._prefetch_depth = self.PREFETCH_DEPTH
+
+        # Search results list, built once and re-filled through its model
+        self._search_store = Gio.ListStore.new(MemoItem)
+        self._search_header = None
+        self._search_listbox = None
+        self._search_empty = None
+
+        # Result rows by (name, updateTime); the previous query's rows are
+        # offered for reuse while the store is re-filled
+        self._search_rows = {}
+        self._reusable_rows = {}
+
+        # (loaded, total) counts of the list hidden behind search results
+        self._pre_search_snapshot = None
 
         self.adjustment = self.scrolled_window.get_vadjustment()
         self._scroll_handler = self.add_signal(
@@ -32,6 +58,10 @@ class MemosView(ViewBase):
         """Clean up resources before destroying"""
         # Call parent cleanup for timeouts and signals
         super().cleanup()
+        for timeout_id in (self._scroll_trailing, self._load_more_timeout):
+            if timeout_id:
+                GLib.source_remove(timeout_id)
+        self._scroll_trailing = self._load_more_timeout = None
         
         # Clean up memo_loader
         if self.memo_loader:
@@ -51,11 +81,11 @@ class MemosView(ViewBase):
         if self.heatmap and self.heatmap.get_parent():
             self.container.remove(self.heatmap)
 
-        self.heatmap = MemoHeatmap()
-        self.heatmap.set_margin_start(20)
-        self.heatmap.set_margin_end(20)
-        self.heatmap.set_margin_top(20)
-        self.heatmap.set_margin_bottom(20)
+        builder = Gtk.Builder.new_from_resource(
+            "/org/quasars/memories/resources/memo_heatmap.ui"
+        )
+        self.heatmap = builder.get_object("heatmap")
+        self._opacity_step = None
         self.container.prepend(self.heatmap)
         self.heatmap.set_memos(memos)
 
@@ -66,6 +96,7 @@ class MemosView(ViewBase):
         self.loaded_memos = len(memos)
         self.total_memos = len(memos) if not page_token else None
         self.is_searching = False
+        self._last_count_label = None  # the window may have relabelled it since
         self._update_count()
 
         self.add_timeout(GLib.timeout_add(100, self._scroll_past_heatmap))
@@ -83,18 +114,57 @@ class MemosView(ViewBase):
     # -------------------------------------------------------------------------
 
     def _on_scroll(self, adjustment):
-        """Heatmap fade + pagination"""
+        """Heatmap fade + pagination, at most once per frame"""
+        now = GLib.get_monotonic_time()
+        if now - self._last_scroll_us < self.SCROLL_INTERVAL_US:
+            # Still pick up the final position once the burst settles
+            if not self._scroll_trailing:
+                self._scroll_trailing = GLib.timeout_add(16, self._on_scroll_trailing)
+            return
+        self._handle_scroll(adjustment, now)
+
+    def _on_scroll_trailing(self):
+        """Run the scroll handler for the last throttled event"""
+        self._scroll_trailing = None
+        self._handle_scroll(self.adjustment, GLib.get_monotonic_time())
+        return False
+
+    def _handle_scroll(self, adjustment, now):
+        """Apply one scroll sample taken at monotonic time now"""
+        elapsed = max(now - self._last_scroll_us, 1)
+        self._last_scroll_us = now
+
         value = adjustment.get_value()
         upper = adjustment.get_upper()
         page_size = adjustment.get_page_size()
 
+        # Fetch one page further ahead while flinging
+        velocity = abs(value - self._last_scroll_value) * 1e6 / elapsed
+        self._last_scroll_value = value
+        fast = velocity > self.FAST_SCROLL
+        self._prefetch_depth = self.PREFETCH_DEPTH + 1 if fast else self.PREFETCH_DEPTH
+
         if self.heatmap:
             opacity = max(0.3, 1.0 - (value / 100.0) * 0.7) if value <= 100 else 0.3
-            self.heatmap.set_opacity(opacity)
-
+            step = round(opacity * 20)
+            if step != self._opacity_step:
+                self._opacity_step = step
+                self.heatmap.set_opacity(step / 20)
+
+        if self.memo_loader and not self.is_searching and not self._load_more_timeout:
+            loader = self.memo_loader
+            if loader.page_token and not loader.loading_more:
+                if value + page_size >= upper - self.PREFETCH_DISTANCE:
+                    self._load_more_timeout = GLib.timeout_add(
+                        100, self._load_more_debounced
+                    )
+
+    def _load_more_debounced(self):
+        """Load the next pages at most once per scroll window"""
+        self._load_more_timeout = None
         if self.memo_loader and not self.is_searching:
-            if value + page_size >= upper - 200:
-                self.memo_loader.load_more(self._on_memos_loaded)
+            self.memo_loader.load_more(self._on_memos_loaded, pages=self._prefetch_depth)
+        return False
 
     def _on_memos_loaded(self, count, has_more):
         """After loading more"""
@@ -109,59 +179,106 @@ class MemosView(ViewBase):
 
     def show_search_results(self, memos, query):
         """Show search results"""
+        if not self.is_searching:
+            self._pre_search_snapshot = (self.loaded_memos, self.total_memos)
         self.is_searching = True
 
-        # Clear
-        child = self.container.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.container.remove(child)
-            child = next_child
+        # Hide the loaded list instead of tearing it down, so restore is instant
+        self._detach_search_widgets()
+        self._set_list_visible(False)
 
+        if self._search_listbox is None:
+            self._build_search_widgets()
+
+        self._reusable_rows, self._search_rows = self._search_rows, {}
+        self._search_store.splice(
+            0, self._search_store.get_n_items(), [MemoItem(m) for m in memos]
+        )
+        self._reusable_rows = {}
         if memos:
-            header = Gtk.Label(label=f"Search results for '{query}'")
-            header.set_xalign(0)
-            header.set_margin_top(24)
-            header.set_margin_bottom(12)
-            header.set_margin_start(20)
-            header.set_margin_end(20)
-            header.add_css_class("title-3")
-            self.container.append(header)
-
-            listbox = Gtk.ListBox()
-            listbox.set_selection_mode(Gtk.SelectionMode.SINGLE)
-            listbox.add_css_class("boxed-list")
-            listbox.connect("row-activated", self._on_search_row_activated)
-
-            for memo in memos:
-                row = MemoRow.create(
-                    memo, self.memo_loader.api, MemoRow.fetch_attachments
-                )
-                row.memo_data = memo
-                listbox.append(row)
-
-            self.container.append(listbox)
+            self._search_header.set_label(f"Search results for '{query}'")
+            self.container.append(self._search_header)
+            self.container.append(self._search_listbox)
         else:
-            label = Gtk.Label(label=f"No results found for '{query}'")
-            label.set_margin_top(48)
-            label.add_css_class("dim-label")
-            self.container.append(label)
+            self._search_empty.set_label(f"No results found for '{query}'")
+            self.container.append(self._search_empty)
 
         self.loaded_memos = len(memos)
         self.total_memos = len(memos)
         self._update_count()
 
+    def _build_search_widgets(self):
+        """Create the search header and model-bound result list"""
+        builder = Gtk.Builder.new_from_resource(
+            "/org/quasars/memories/resources/memo_section.ui"
+        )
+        self._search_header = builder.get_object("header")
+        self._search_listbox = builder.get_object("listbox")
+        self._search_listbox.bind_model(self._search_store, self._create_search_row)
+
+        # Untracked: the listbox is built once and lives as long as this view,
+        # so cleanup() on disconnect must not cut it off
+        self._search_listbox.connect("row-activated", self._on_search_row_activated)
+
+        self._search_empty = Gtk.Builder.new_from_resource(
+            "/org/quasars/memories/resources/search_empty.ui"
+        ).get_object("search_empty")
+
+    def _set_list_visible(self, visible):
+        """Show or hide everything currently in the container"""
+        child = self.container.get_first_child()
+        while child:
+            child.set_visible(visible)
+            child = child.get_next_sibling()
+
+    def discard_search_snapshot(self):
+        """Forget the hidden list so the next restore refetches it"""
+        self._pre_search_snapshot = None
+
+    def _detach_search_widgets(self):
+        """Take the search results out of the container"""
+        for widget in (self._search_header, self._search_listbox, self._search_empty):
+            if widget is not None and widget.get_parent() is self.container:
+                self.container.remove(widget)
+
+    def leave_search(self):
+        """Drop the search results and show the hidden list again"""
+        self.is_searching = False
+        self._pre_search_snapshot = None
+        self._detach_search_widgets()
+        self._search_store.remove_all()
+        self._search_rows.clear()
+        self._set_list_visible(True)
+
+    def _create_search_row(self, item):
+        """Build a result row for a MemoItem, reusing an unchanged row from the last query"""
+        memo = item.memo
+        key = (memo.get("name"), memo.get("updateTime"))
+        row = self._reusable_rows.pop(key, None)
+        if row is None or row.get_parent() is not None:
+            row = MemoRow.create(memo, self.memo_loader.api, MemoRow.fetch_attachments)
+        row.memo_data = memo
+        self._search_rows[key] = row
+        return row
+
     def _on_search_row_activated(self, listbox, row):
         """Handle search result click"""
-        if hasattr(row, "memo_data") and self.memo_loader.on_memo_clicked:
-            self.memo_loader.on_memo_clicked(row.memo_data)
+        loader = self.memo_loader
+        if hasattr(row, "memo_data") and loader and loader.on_memo_clicked:
+            loader.on_memo_clicked(row.memo_data)
 
     def restore_all_memos(self):
         """Restore full list"""
         if not self.memo_loader:
             return
 
-        self.is_searching = False
+        # Unchanged since the search started: just show it again
+        snapshot = self._pre_search_snapshot
+        self.leave_search()
+        if snapshot is not None:
+            self.loaded_memos, self.total_memos = snapshot
+            self._update_count()
+            return
 
         if self.heatmap and not self.heatmap.get_parent():
             self.container.prepend(self.heatmap)
@@ -184,10 +301,13 @@ class MemosView(ViewBase):
             return
 
         if self.total_memos is None:
-            self.memo_count_label.set_label(f"{self.loaded_memos} memos loaded")
+            msg = f"{self.loaded_memos} memos loaded"
         elif self.total_memos != self.loaded_memos:
-            self.memo_count_label.set_label(
-                f"{self.loaded_memos} of {self.total_memos} memos"
-            )
+            msg = f"{self.loaded_memos} of {self.total_memos} memos"
         else:
-            self.memo_count_label.set_label(f"{self.loaded_memos} memos")
+            msg = f"{self.loaded_memos} memos"
+
+        # Identical text would still invalidate the label's layout
+        if msg != self._last_count_label:
+            self.memo_count_label.set_label(msg)
+            self._last_count_label = msg
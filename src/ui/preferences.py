@@ -1,14 +1,18 @@
 # ui/preferences.py
 # Preferences window: server credentials, app settings
 
-from gi.repository import Adw, Gtk
+from gi.repository import Adw, GLib, Gtk
 
+from ..api.memos_api import MemosAPI
+from ..utils import async_executor
 from ..utils.settings import Settings
 
 
 class PreferencesWindow(Adw.PreferencesWindow):
     """App preferences"""
 
+    SAVE_DELAY = 400  # ms of quiet before credential edits are written
+
     def __init__(self, parent, on_credentials_changed=None, on_credentials_cleared=None):
         super().__init__()
         self.set_transient_for(parent)
@@ -18,9 +22,22 @@ class PreferencesWindow(Adw.PreferencesWindow):
         self.settings = Settings()
         self.on_credentials_changed = on_credentials_changed
         self.on_credentials_cleared = on_credentials_cleared
+        self._closed = False
+        self._save_timeout = None
+        self._edited = set()  # rows the user has changed; only these are written
+        self._handlers = {}  # row -> its changed handler, blocked while loading
+        self.connect("close-request", self._on_close_request)
 
         self._build_ui()
-        self._load_settings()
+
+        # Settings reads can block on first access; fill the rows when they return
+        async_executor.submit(self._load_settings)
+
+    def _on_close_request(self, window):
+        """Write pending edits and stop late results from touching a closed window"""
+        self._flush_settings()
+        self._closed = True
+        return False
 
     def _build_ui(self):
         """Build preferences UI"""
@@ -39,13 +56,15 @@ class PreferencesWindow(Adw.PreferencesWindow):
         # Server URL
         self.url_row = Adw.EntryRow()
         self.url_row.set_title("Server URL")
-        self.url_row.connect("changed", self._on_changed)
+        self._handlers[self.url_row] = self.url_row.connect("changed", self._on_changed)
         creds_group.add(self.url_row)
 
         # API Token
         self.token_row = Adw.PasswordEntryRow()
         self.token_row.set_title("API Token")
-        self.token_row.connect("changed", self._on_changed)
+        self._handlers[self.token_row] = self.token_row.connect(
+            "changed", self._on_changed
+        )
         creds_group.add(self.token_row)
 
         # Test connection button
@@ -78,42 +97,70 @@ class PreferencesWindow(Adw.PreferencesWindow):
         string_list.append("15 minutes")
         self.refresh_row.set_model(string_list)
         
-        self.refresh_row.connect("notify::selected", self._on_refresh_interval_changed)
+        self._handlers[self.refresh_row] = self.refresh_row.connect(
+            "notify::selected", self._on_refresh_interval_changed
+        )
         settings_group.add(self.refresh_row)
 
     def _load_settings(self):
-        """Load saved credentials and settings"""
-        url = self.settings.get_server_url() or ""
-        token = self.settings.get_api_token() or ""
-        self.url_row.set_text(url)
-        self.token_row.set_text(token)
-        
-        # Load auto-refresh interval
-        interval = self.settings.get_auto_refresh_interval()
+        """Load saved credentials and settings (runs off the main thread)"""
+        settings = Settings()
+        url = settings.get_server_url() or ""
+        token = settings.get_api_token() or ""
+        interval = settings.get_auto_refresh_interval()
+        GLib.idle_add(self._apply_loaded_settings, url, token, interval)
+
+    def _apply_loaded_settings(self, url, token, interval):
+        """Fill the rows the user hasn't touched yet, without re-saving the values"""
+        if self._closed:
+            return False
+
         # Map interval to combo box index (5->0, 10->1, 15->2)
         index = {5: 0, 10: 1, 15: 2}.get(interval, 0)
-        self.refresh_row.set_selected(index)
+        for row, setter, value in (
+            (self.url_row, self.url_row.set_text, url),
+            (self.token_row, self.token_row.set_text, token),
+            (self.refresh_row, self.refresh_row.set_selected, index),
+        ):
+            if row not in self._edited:
+                with row.handler_block(self._handlers[row]):
+                    setter(value)
+        return False
 
     def _on_changed(self, row):
-        """Save on change"""
-        self.settings.set_server_url(self.url_row.get_text().strip())
-        self.settings.set_api_token(self.token_row.get_text().strip())
+        """Save once typing pauses"""
+        self._edited.add(row)
+        if self._save_timeout:
+            GLib.source_remove(self._save_timeout)
+        self._save_timeout = GLib.timeout_add(self.SAVE_DELAY, self._flush_settings)
+
+    def _flush_settings(self):
+        """Write edited credential rows to settings if an edit is pending"""
+        if self._save_timeout:
+            GLib.source_remove(self._save_timeout)
+            self._save_timeout = None
+            # An untouched row may still be waiting for its saved value
+            if self.url_row in self._edited:
+                self.settings.set_server_url(self.url_row.get_text().strip())
+            if self.token_row in self._edited:
+                self.settings.set_api_token(self.token_row.get_text().strip())
+        return False
 
     def _on_refresh_interval_changed(self, combo_row, param):
         """Save auto-refresh interval"""
+        self._edited.add(combo_row)
         index = combo_row.get_selected()
         # Map index to interval (0->5, 1->10, 2->15)
         interval = [5, 10, 15][index]
         self.settings.set_auto_refresh_interval(interval)
         
         # Notify parent window to restart timer
+        self._flush_settings()
         if self.on_credentials_changed:
             self.on_credentials_changed()
 
     def _on_test_clicked(self, button):
         """Test connection"""
-        from ..api.memos_api import MemosAPI
-
         url = self.url_row.get_text().strip()
         token = self.token_row.get_text().strip()
 
@@ -125,16 +172,29 @@ class PreferencesWindow(Adw.PreferencesWindow):
         self._show_status("Connecting...")
 
         api = MemosAPI(url, token)
+        async_executor.submit(self._do_test, api, button)
+
+    def _do_test(self, api, button):
+        """Run the connection test (runs off the main thread)"""
         success, message = api.test_connection()
+        GLib.idle_add(self._finish_test, success, message, button)
+
+    def _finish_test(self, success, message, button):
+        """Show the connection test result"""
+        # The credentials are saved either way, so the parent still hears about them
+        self._flush_settings()
+        if success and self.on_credentials_changed:
+            self.on_credentials_changed()
+        if self._closed:
+            return False
 
         if success:
             self._show_status("Connected!", error=False)
-            if self.on_credentials_changed:
-                self.on_credentials_changed()
         else:
             self._show_status(f"Failed: {message}", error=True)
 
         button.set_sensitive(True)
+        return False
 
     def _show_status(self, message, error=False):
         """Show status message"""
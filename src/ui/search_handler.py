@@ -1,14 +1,19 @@
 # ui/search_handler.py
 # Search bar: toggle, debounce, API search
 
-import threading
+from collections import OrderedDict
 
 from gi.repository import GLib
 
+from ..utils import async_executor
+
 
 class SearchHandler:
     """Search bar controller"""
 
+    CACHE_SIZE = 32
+    MIN_QUERY_LEN = 2  # a lone ASCII character matches too much to be worth a request
+
     def __init__(self, api, search_entry, search_bar, search_button):
         self.api = api
         self.search_entry = search_entry
@@ -16,8 +21,15 @@ class SearchHandler:
         self.search_button = search_button
         self.on_results_callback = None
         self.last_query = None
+        self._shown_query = None  # query whose results are on screen
         self._search_timeout = None
 
+        # Bumped per search and on clear; older results are dropped
+        self._active_query_id = 0
+
+        # query -> results, most recently used last
+        self._cache = OrderedDict()
+
         # Signals
         self.search_button.connect("toggled", self._on_toggled)
         self.search_entry.connect("search-changed", self._on_changed)
@@ -61,21 +73,58 @@ class SearchHandler:
             except Exception:
                 pass
             self._search_timeout = None
+
+        # Too short to search: no request, drop any still in flight, and
+        # take down results for the longer query this was trimmed from.
+        # One CJK character is already a word, so only ASCII is held back
+        if len(query) < self.MIN_QUERY_LEN and query.isascii():
+            self._active_query_id += 1
+            if self._shown_query is not None:
+                self._shown_query = None
+                if self.on_results_callback:
+                    self.on_results_callback(None, [])
+            return
+
         self._search_timeout = GLib.timeout_add(300, self._search, query)
 
     def _search(self, query):
         """Execute search in background"""
         self._search_timeout = None  # Clear since it fired
+        self._active_query_id += 1
 
-        def worker():
-            success, memos, _ = self.api.search_memos(query)
-            GLib.idle_add(self._on_results, query, memos if success else [])
+        if query in self._cache:
+            self._cache.move_to_end(query)
+            self._on_results(query, self._cache[query])
+            return False
 
-        threading.Thread(target=worker, daemon=True).start()
+        qid = self._active_query_id
+        async_executor.submit(self._fetch, qid, query, on_done=self._on_fetched)
         return False
 
-    def _on_results(self, query, memos):
+    def _fetch(self, qid, query):
+        """Run the API search (runs on the worker pool)"""
+        # Still queued behind other work when a newer query arrived: skip the request
+        if qid != self._active_query_id:
+            return None
+        success, memos, _ = self.api.search_memos(query)
+        return qid, query, memos if success else [], success
+
+    def _on_fetched(self, result):
+        """Hand results to _on_results unless a newer search superseded them"""
+        if result is None:
+            return
+        qid, query, memos, success = result
+        if qid == self._active_query_id:
+            self._on_results(query, memos, success)
+
+    def _on_results(self, query, memos, cache=False):
         """Deliver results via callback"""
+        if cache:
+            self._cache[query] = memos
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        self._shown_query = query
         if self.on_results_callback:
             self.on_results_callback(query, memos)
 
@@ -83,5 +132,14 @@ class SearchHandler:
         """Clear search and restore list"""
         self.search_entry.set_text("")
         self.last_query = None
+        self._shown_query = None
+        self._active_query_id += 1
+        if self._search_timeout:
+            GLib.source_remove(self._search_timeout)
+            self._search_timeout = None
         if self.on_results_callback:
             self.on_results_callback(None, [])
+
+    def invalidate_cache(self):
+        """Drop cached results after memos change"""
+        self._cache.clear()
@@ -0,0 +1,115 @@
+# utils/async_executor.py
+# Shared worker pools: one for user actions, one for background loading
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+
+from gi.repository import GLib
+
+log = logging.getLogger(__name__)
+
+BACKGROUND_WORKERS = 4
+
+
+class _DaemonPool:
+    """Bounded pool of daemon workers, so neither queued nor running calls hold up exit"""
+
+    def __init__(self, max_workers, name):
+        self._queue = queue.SimpleQueue()
+        self._threads = []
+        self._max_workers = max_workers
+        self._name = name
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args):
+        """Queue fn(*args); the returned future can be cancelled until it starts"""
+        future = Future()
+        self._queue.put((future, fn, args))
+        with self._lock:
+            if len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self._name}-{len(self._threads)}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def cancel_pending(self):
+        """Cancel everything still queued"""
+        while True:
+            try:
+                future, _, _ = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            future.cancel()
+
+    def _work(self):
+        """Run queued calls until the process exits"""
+        while True:
+            future, fn, args = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
+# User actions (save, delete, search, connect...) never queue behind background loading
+_POOL = _DaemonPool(4, "memos-io")
+
+# Thumbnails, page prefetch and heatmap counts
+_BACKGROUND = _DaemonPool(BACKGROUND_WORKERS, "memos-bg")
+
+
+def submit(fn, *args, on_done=None):
+    """
+    Run fn(*args) on the user-action pool.
+    on_done(result) runs on the main loop; result is None if fn raised.
+    Failures are logged either way.
+    """
+    return _submit(_POOL, fn, args, on_done)
+
+
+def submit_background(fn, *args, on_done=None):
+    """Like submit, on the background pool, for work nobody is waiting on"""
+    return _submit(_BACKGROUND, fn, args, on_done)
+
+
+def shutdown():
+    """Drop queued work; running calls are on daemon threads and don't delay exit"""
+    _POOL.cancel_pending()
+    _BACKGROUND.cancel_pending()
+
+
+def _submit(pool, fn, args, on_done):
+    """Queue fn on pool and route its outcome"""
+    future = pool.submit(fn, *args)
+    if on_done is None:
+        future.add_done_callback(_log_failure)
+    else:
+        future.add_done_callback(lambda f: GLib.idle_add(_deliver, f, on_done))
+    return future
+
+
+def _log_failure(future):
+    """Log a failed fire-and-forget task (runs on the worker)"""
+    if not future.cancelled() and future.exception() is not None:
+        log.warning("Background task failed: %s", future.exception())
+
+
+def _deliver(future, on_done):
+    """Hand a finished future's result to its callback"""
+    if future.cancelled():
+        return False
+    error = future.exception()
+    if error is not None:
+        log.warning("Background task failed: %s", error)
+    on_done(None if error is not None else future.result())
+    return False
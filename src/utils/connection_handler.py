@@ -1,11 +1,10 @@
 # utils/connection_handler.py
 # Async API connection: test, auth, fetch initial memos
 
-import threading
-
 from gi.repository import GLib
 
 from ..api.memos_api import MemosAPI
+from . import async_executor
 
 
 class ConnectionHandler:
@@ -14,7 +13,7 @@ class ConnectionHandler:
     @staticmethod
     def connect(base_url, token, on_success, on_failure):
         """
-        Connect to Memos API in background thread.
+        Connect to Memos API on the shared worker pool.
         on_success(api, memos, page_token, user_info)
         on_failure(message)
         """
@@ -47,4 +46,4 @@ class ConnectionHandler:
             except Exception as e:
                 GLib.idle_add(on_failure, str(e))
 
-        threading.Thread(target=worker, daemon=True).start()
+        async_executor.submit(worker)
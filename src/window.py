@@ -1,7 +1,6 @@
 # window.py
 # Main window: connection, memo list, editor
 
-import threading
 import time
 import weakref
 
@@ -9,9 +8,11 @@ from gi.repository import Adw, Gio, GLib, Gtk
 
 from .ui.connection_view import ConnectionView
 from .ui.memo_edit_view import MemoEditView
+from .ui.memo_row import MemoRow
 from .ui.memos_view import MemosView
 from .ui.preferences import PreferencesWindow
 from .ui.search_handler import SearchHandler
+from .utils import async_executor
 from .utils.settings import Settings
 
 
@@ -153,6 +154,9 @@ class MemoriesWindow(Adw.ApplicationWindow):
         
         if self.search_handler:
             self.search_handler.on_results_callback = None
+
+        # Thumbnails of private attachments don't outlive the session
+        MemoRow.purge_thumbnail_cache()
         
         # Clear references
         self.api = None
@@ -163,12 +167,18 @@ class MemoriesWindow(Adw.ApplicationWindow):
         self._last_refresh_time = None
         self._last_timer_check = None
 
-        # Clear container
+        # Clear container: collect first, then detach while hidden so the
+        # layout is invalidated once rather than per child
+        children = []
         child = self.memos_container.get_first_child()
         while child:
-            next_child = child.get_next_sibling()
+            children.append(child)
+            child = child.get_next_sibling()
+        visible = self.memos_container.get_visible()
+        self.memos_container.set_visible(False)
+        for child in children:
             self.memos_container.remove(child)
-            child = next_child
+        self.memos_container.set_visible(visible)
 
         self.server_label.set_label("")
         self.connection_status_label.set_label("")
@@ -209,7 +219,7 @@ class MemoriesWindow(Adw.ApplicationWindow):
             ok, fresh = self.api.get_memo(memo.get("name"))
             GLib.idle_add(self._load_memo_in_editor, fresh if ok else memo)
 
-        threading.Thread(target=worker, daemon=True).start()
+        async_executor.submit(worker)
 
     def _load_memo_in_editor(self, memo):
         """Load into editor"""
@@ -220,6 +230,7 @@ class MemoriesWindow(Adw.ApplicationWindow):
         """Back to list"""
         if self._needs_reload:
             if self._search_query:
+                self.memos_view.discard_search_snapshot()
                 self._perform_search_refresh()
             else:
                 self._reload_memos()
@@ -259,7 +270,7 @@ class MemoriesWindow(Adw.ApplicationWindow):
             success, memos, _ = self.api.search_memos(self._search_query)
             GLib.idle_add(self._on_search_refresh_complete, success, memos)
 
-        threading.Thread(target=worker, daemon=True).start()
+        async_executor.submit(worker)
 
     def _on_search_refresh_complete(self, success, memos):
         """Update search results"""
@@ -300,7 +311,7 @@ class MemoriesWindow(Adw.ApplicationWindow):
 
             GLib.idle_add(self._on_save_complete, success, result, is_autosave)
 
-        threading.Thread(target=worker, daemon=True).start()
+        async_executor.submit(worker)
 
     def _on_save_complete(self, success, result, is_autosave):
         """Handle save complete"""
@@ -317,6 +328,8 @@ class MemoriesWindow(Adw.ApplicationWindow):
         if success:
             # Mark that list needs reload, but don't navigate away
             self._needs_reload = True
+            if self.search_handler:
+                self.search_handler.invalidate_cache()
 
     def _on_delete_memo(self, memo):
         """Delete memo"""
@@ -327,12 +340,14 @@ class MemoriesWindow(Adw.ApplicationWindow):
             success = self.api.delete_memo(memo.get("name"))
             GLib.idle_add(self._on_delete_complete, success)
 
-        threading.Thread(target=worker, daemon=True).start()
+        async_executor.submit(worker)
 
     def _on_delete_complete(self, success):
         """Handle delete complete"""
         if success:
             self._clear_search_state()
+            if self.search_handler:
+                self.search_handler.invalidate_cache()
             self._reload_memos()
             self.main_stack.set_visible_child_name("memos")
 
@@ -347,13 +362,17 @@ class MemoriesWindow(Adw.ApplicationWindow):
             success, memos, page_token = self.api.get_memos()
             GLib.idle_add(self._on_reload_complete, success, memos, page_token)
 
-        threading.Thread(target=worker, daemon=True).start()
+        async_executor.submit(worker)
 
     def _on_reload_complete(self, success, memos, page_token):
         """Handle reload"""
         if not success:
             return
 
+        # A reload always lands on the full list, even if it started from search
+        self.memos_view.leave_search()
+        if self.search_handler:
+            self.search_handler.invalidate_cache()
         self.memos_view.memo_loader.page_token = page_token
         self.memos_view.memo_loader.load_initial(memos)
         self.memos_view.heatmap.set_memos(memos)
@@ -441,7 +460,7 @@ class MemoriesWindow(Adw.ApplicationWindow):
             success, memos, page_token = self.api.get_memos()
             GLib.idle_add(self._on_auto_refresh_complete, success, memos, page_token)
         
-        threading.Thread(target=worker, daemon=True).start()
+        async_executor.submit_background(worker)
         
         # Keep timer running
         return True
@@ -455,7 +474,14 @@ class MemoriesWindow(Adw.ApplicationWindow):
         self._last_refresh_time = time.time()
         self._update_refresh_status_display()
         
+        # A search started while this was in flight: leave its results alone
+        if self.memos_view.is_searching:
+            return
+
         # Silently update the list
+        self.memos_view.discard_search_snapshot()
+        if self.search_handler:
+            self.search_handler.invalidate_cache()
         self.memos_view.memo_loader.page_token = page_token
         self.memos_view.memo_loader.load_initial(memos)
         if self.memos_view.heatmap: